@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import sys
 import io
+import json
+import contextvars
 import logging
 from logging.handlers import RotatingFileHandler
 import os
@@ -8,12 +10,13 @@ import time
 from datetime import datetime
 from pathlib import Path
 from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import uuid4
-import webbrowser
-from urllib.request import urlopen
-from urllib.error import URLError
 import socket
-import psutil
+
+import log_reader
+import metrics
+
 
 def get_console_stream():
     for stream in (sys.stdout, sys.__stdout__, sys.stderr, sys.__stderr__):
@@ -44,16 +47,25 @@ LOG_FILE = LOG_DIR / "translation-server.log"
 # 로깅 설정
 console_stream = get_console_stream()
 log_handlers = [logging.StreamHandler(console_stream)] if console_stream else []
+# 콘솔 출력 레벨 (CLI는 WARNING으로 낮춰 진행률 출력과 섞이지 않게 함), 파일/메모리 버퍼는 INFO 그대로
+for console_handler in log_handlers:
+    console_handler.setLevel(os.environ.get("CONSOLE_LOG_LEVEL", "INFO").upper())
 try:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
+    # delay=True: 첫 로그를 쓸 때 파일을 엶
     file_handler = RotatingFileHandler(
-        str(LOG_FILE), maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"
+        str(LOG_FILE), maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8", delay=True
     )
     log_handlers.append(file_handler)
 except Exception as log_exc:
     log_handlers.append(logging.StreamHandler(sys.stdout))
     print(f"[Warning] Failed to initialize file logging: {log_exc}")
 
+# 웹 콘솔 조회용 메모리 링 버퍼 (최근 LOG_BUFFER_SIZE개 레코드, 조회 시 디스크 I/O 없음)
+LOG_BUFFER_SIZE = int(os.environ.get("LOG_BUFFER_SIZE", "2000"))
+log_buffer = log_reader.LogRingBuffer(capacity=LOG_BUFFER_SIZE)
+log_handlers.append(log_buffer)
+
 logging.basicConfig(
     level=logging.INFO,  # DEBUG -> INFO로 변경 (로그 줄이기)
     format='[%(asctime)s] [%(levelname)s] %(message)s',
@@ -65,10 +77,13 @@ logger.setLevel(logging.INFO)
 
 logger.info(f"Log File: {LOG_FILE}")
 
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_file, send_from_directory
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 
+from job_queue import FINISHED_STATES, JobRegistry
+from rate_limiter import LLMThrottle, backoff_with_jitter
+
 # 무거운 라이브러리는 필요할 때만 임포트 (지연 임포트)
 # from openpyxl import load_workbook
 # import google.generativeai as genai
@@ -78,8 +93,77 @@ DEFAULT_PORT = 5000
 MAX_UPLOAD_MB = int(os.environ.get("MAX_UPLOAD_MB", "50"))
 MAX_CONTENT_LENGTH = MAX_UPLOAD_MB * 1024 * 1024
 ALLOWED_EXTENSIONS = {".xlsx"}
+# 일괄 업로드(/upload/batch): 한 작업에 넣을 최대 파일 수, zip 압축 해제 총량 상한
+BATCH_MAX_FILES = int(os.environ.get("BATCH_MAX_FILES", "200"))
+BATCH_MAX_EXTRACT_MB = int(os.environ.get("BATCH_MAX_EXTRACT_MB", "500"))
 GEMINI_MAX_RETRIES = int(os.environ.get("GEMINI_MAX_RETRIES", "3"))
 GEMINI_RETRY_BACKOFF = float(os.environ.get("GEMINI_RETRY_BACKOFF", "1.0"))
+# 동시에 번역 요청을 보낼 최대 워커 수 (1이면 기존처럼 순차 처리)
+TRANSLATION_CONCURRENCY = max(1, int(os.environ.get("TRANSLATION_CONCURRENCY", "4")))
+# 동시에 처리할 번역 작업(업로드) 수, 나머지는 큐에서 대기
+TRANSLATION_JOB_WORKERS = max(1, int(os.environ.get("TRANSLATION_JOB_WORKERS", "2")))
+# 한 번의 요청에 묶어 보낼 셀 수/문자 수 상한 (MAX_ITEMS=1이면 배치 모드 비활성화)
+TRANSLATION_BATCH_MAX_ITEMS = max(1, int(os.environ.get("TRANSLATION_BATCH_MAX_ITEMS", "20")))
+TRANSLATION_BATCH_MAX_CHARS = max(1, int(os.environ.get("TRANSLATION_BATCH_MAX_CHARS", "4000")))
+# 한글이 없는(또는 한글 비율이 THRESHOLD 미만인) 셀은 LLM에 보내지 않고 그대로 둠
+TRANSLATION_SKIP_NON_KOREAN = os.environ.get("TRANSLATION_SKIP_NON_KOREAN", "1").lower() not in ("0", "false", "no")
+TRANSLATION_HANGUL_THRESHOLD = float(os.environ.get("TRANSLATION_HANGUL_THRESHOLD", "0"))
+# 한글 줄과 영어 줄이 섞인 셀은 한글이 있는 줄만 번역 (일부만 번역된 시트 정리용)
+TRANSLATION_KOREAN_SPANS_ONLY = os.environ.get("TRANSLATION_KOREAN_SPANS_ONLY", "0").lower() in ("1", "true", "yes")
+# 추정 토큰 수가 이보다 큰 셀은 줄/문장 경계에서 나눠 조각별로 동시에 번역 (0이면 나누지 않음)
+TRANSLATION_CHUNK_TOKENS = max(0, int(os.environ.get("TRANSLATION_CHUNK_TOKENS", "1500")))
+# 줄 단위 분할 번역: off(사용 안 함) / steps(Test Steps 열만) / all(모든 열)
+TRANSLATION_SEGMENT_MODE = os.environ.get("TRANSLATION_SEGMENT_MODE", "steps").lower()
+# Gemini 호출 속도 제한 (0이면 제한 없음) 및 적응형 동시 요청 수 범위
+GEMINI_RPM = float(os.environ.get("GEMINI_RPM", "0"))
+GEMINI_TPM = float(os.environ.get("GEMINI_TPM", "0"))
+GEMINI_MIN_INFLIGHT = max(1, int(os.environ.get("GEMINI_MIN_INFLIGHT", "1")))
+GEMINI_MAX_INFLIGHT = max(
+    GEMINI_MIN_INFLIGHT,
+    int(os.environ.get("GEMINI_MAX_INFLIGHT", str(TRANSLATION_CONCURRENCY * TRANSLATION_JOB_WORKERS))),
+)
+# 진행률 스트림(SSE): 변경이 없을 때 keep-alive 주기, 이벤트 사이 최소 간격(버스트 병합)
+STATUS_STREAM_KEEPALIVE = float(os.environ.get("STATUS_STREAM_KEEPALIVE", "15"))
+STATUS_STREAM_MIN_INTERVAL = float(os.environ.get("STATUS_STREAM_MIN_INTERVAL", "0.25"))
+# /logs 커서 모드에서 한 번에 돌려줄 최대 바이트 (넘으면 앞부분을 건너뛰고 truncated 표시)
+LOG_TAIL_MAX_BYTES = int(os.environ.get("LOG_TAIL_MAX_BYTES", str(256 * 1024)))
+# 체크포인트: 완료된 번역을 작업 폴더의 저널에 기록해 중단된 작업을 이어서 처리
+CHECKPOINT_FSYNC_INTERVAL = float(os.environ.get("CHECKPOINT_FSYNC_INTERVAL", "5"))
+CHECKPOINT_MAX_AGE_DAYS = float(os.environ.get("CHECKPOINT_MAX_AGE_DAYS", "7"))
+CHECKPOINT_AUTO_RESUME = os.environ.get("CHECKPOINT_AUTO_RESUME", "0").lower() in ("1", "true", "yes")
+# 서버가 포트를 연 뒤 백그라운드에서 LLM 클라이언트와 번역 모듈을 미리 로드 (첫 업로드 지연 방지)
+SERVER_PREWARM = os.environ.get("SERVER_PREWARM", "1").lower() not in ("0", "false", "no")
+# prewarm 때 LLM에 가벼운 요청을 보내 연결/모델을 준비하고, 유휴 상태가 이 간격(초)을 넘으면 다시 호출 (0이면 끔)
+LLM_PREWARM = os.environ.get("LLM_PREWARM", "1").lower() not in ("0", "false", "no")
+LLM_KEEPALIVE_INTERVAL = float(os.environ.get("LLM_KEEPALIVE_INTERVAL", "240"))
+# 작업이 없고 마지막 번역 요청(또는 서버 시작) 후 이 시간(초)이 지나면 keep-alive 호출을 멈춤 (0이면 계속 유지)
+LLM_KEEPALIVE_MAX_IDLE = float(os.environ.get("LLM_KEEPALIVE_MAX_IDLE", "1800"))
+# 번역 대상 열: KNOWN_COLUMNS 이름(Test Steps, Expected Result, Precondition, Title) 또는 "context=헤더 정규식"
+TRANSLATION_COLUMNS = os.environ.get("TRANSLATION_COLUMNS", "Test Steps,Expected Result")
+# 결과 저장: 번역된 셀만 xlsx zip 안에서 교체 (나머지 파트는 그대로 복사)
+EXCEL_PATCH_WRITER = os.environ.get("EXCEL_PATCH_WRITER", "1").lower() not in ("0", "false", "no")
+# 패치할 수 없는 파일 중 이 크기 이상은 행 단위 스트리밍으로 저장 (작은 파일은 서식을 모두 보존하는 일반 저장)
+EXCEL_STREAMING_MIN_MB = float(os.environ.get("EXCEL_STREAMING_MIN_MB", "10"))
+# 번역 백엔드: gemini(클라우드 API) / ollama(로컬 LLM)
+TRANSLATION_MODE = os.environ.get("TRANSLATION_MODE", "gemini").lower()
+GEMINI_MODEL_NAME = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3.2:7b-instruct-q4_K_M")
+LLM_REQUEST_TIMEOUT = float(os.environ.get("LLM_REQUEST_TIMEOUT", "120"))
+# 스트리밍 응답: 첫 토큰/다음 조각이 제한 시간(초)을 넘기면 요청을 끊고 바로 재시도 (0이면 해당 제한 없음)
+LLM_STREAMING = os.environ.get("LLM_STREAMING", "1").lower() not in ("0", "false", "no")
+LLM_FIRST_TOKEN_TIMEOUT = float(os.environ.get("LLM_FIRST_TOKEN_TIMEOUT", "60"))
+LLM_STALL_TIMEOUT = float(os.environ.get("LLM_STALL_TIMEOUT", "30"))
+# 프롬프트 문구를 바꾸면 올려서 기존 번역 메모리를 무효화
+PROMPT_VERSION = "qa-v1"
+# 용어집 (CSV/TSV/JSON, 없으면 DATA_DIR/glossary.csv|tsv|json) 및 프롬프트에 넣을 최대 용어 수
+GLOSSARY_FILE = os.environ.get("GLOSSARY_FILE", "")
+GLOSSARY_MAX_TERMS = int(os.environ.get("GLOSSARY_MAX_TERMS", "40"))
+GLOSSARY_EXTENSIONS = (".csv", ".tsv", ".json")
+# 번역 메모리 (DATA_DIR 아래 SQLite)
+TRANSLATION_CACHE_ENABLED = os.environ.get("TRANSLATION_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.environ.get("TRANSLATION_CACHE_MAX_ENTRIES", "200000"))
+TRANSLATION_CACHE_MAX_AGE_DAYS = float(os.environ.get("TRANSLATION_CACHE_MAX_AGE_DAYS", "180"))
 
 
 def get_resource_dir() -> Path:
@@ -114,8 +198,10 @@ RESOURCE_DIR = get_resource_dir()
 DATA_DIR = get_app_data_dir()
 UPLOAD_FOLDER = DATA_DIR / "uploads"
 OUTPUT_FOLDER = DATA_DIR / "outputs"
+CHECKPOINT_FOLDER = DATA_DIR / "jobs"
 UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
 OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
+CHECKPOINT_FOLDER.mkdir(parents=True, exist_ok=True)
 
 app = Flask(
     __name__,
@@ -132,27 +218,28 @@ logger.info(f"Data Directory: {DATA_DIR}")
 logger.info(f"Upload Folder: {UPLOAD_FOLDER}")
 logger.info(f"Output Folder: {OUTPUT_FOLDER}")
 
-# 번역 상태를 저장할 전역 변수
-status_lock = Lock()
-
-
 def _new_status() -> dict:
     return {
         "job_id": None,
         "progress": 0,
         "total": 0,
         "current": 0,
+        "unique_total": 0,
+        "unique_current": 0,
+        "restored": 0,
         "status": "idle",
         "estimated_time": 0,
         "output_file": None,
         "error": None,
         "started_at": None,
         "completed_at": None,
+        "sheets": [],
+        "files": [],
+        "in_flight": [],
+        "metrics": None,
     }
 
 
-translation_status = _new_status()
-
 # Heartbeat 관리 (브라우저 연결 모니터링)
 last_heartbeat = None
 heartbeat_lock = Lock()
@@ -160,34 +247,78 @@ HEARTBEAT_TIMEOUT = 30  # 초 (30초 동안 heartbeat 없으면 종료)
 shutdown_flag = False
 
 
-def get_status_snapshot() -> dict:
-    with status_lock:
-        return dict(translation_status)
+def get_status_snapshot(job_id: str | None = None) -> dict | None:
+    """job_id의 상태 (없으면 가장 최근 작업, 작업이 하나도 없으면 idle 상태)"""
+    if job_id:
+        return job_registry.get(job_id)
+    return job_registry.latest() or _new_status()
+
+
+def update_status(job_id: str, **kwargs) -> None:
+    job_registry.update(job_id, **kwargs)
 
 
-def update_status(**kwargs) -> None:
-    with status_lock:
-        translation_status.update(kwargs)
+def set_error_once(job_id: str, message: str) -> None:
+    job_registry.set_error_once(job_id, message)
 
 
-def set_error_once(message: str) -> None:
-    with status_lock:
-        if not translation_status.get("error"):
-            translation_status["error"] = message
+class InFlightRequests:
+    """작업에서 모델 응답을 기다리는 요청 목록 (status의 in_flight, 오래된 순)
 
+    워커 스레드에서 갱신하므로 스레드 안전하며, 상태 반영은 STATUS_STREAM_MIN_INTERVAL 간격으로 묶는다.
+    """
 
-def reset_status(job_id: str | None = None, output_file: str | None = None) -> None:
-    base = _new_status()
-    base["job_id"] = job_id
-    base["output_file"] = output_file
-    with status_lock:
-        translation_status.clear()
-        translation_status.update(base)
+    MAX_LISTED = 20
 
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self._lock = Lock()
+        self._requests = {}
+        self._next_id = 0
+        self._last_publish = 0.0
 
-def is_processing() -> bool:
-    with status_lock:
-        return translation_status.get("status") == "processing"
+    def start(self, cells: list[str], context: str) -> int:
+        preview = " ".join(cells[0].split()) if cells else ""
+        with self._lock:
+            request_id = self._next_id
+            self._next_id += 1
+            self._requests[request_id] = {
+                "cells": len(cells),
+                "preview": preview[:80],
+                "context": context,
+                "state": "waiting",
+                "attempt": 1,
+                "chars": 0,
+                "started": time.monotonic(),
+            }
+            self._publish_locked()
+        return request_id
+
+    def update(self, request_id: int, **fields) -> None:
+        with self._lock:
+            self._requests[request_id].update(fields)
+            self._publish_locked()
+
+    def finish(self, request_id: int) -> None:
+        with self._lock:
+            self._requests.pop(request_id, None)
+            self._publish_locked(force=not self._requests)
+
+    def _publish_locked(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_publish < STATUS_STREAM_MIN_INTERVAL:
+            return
+        self._last_publish = now
+        listed = sorted(self._requests.values(), key=lambda entry: entry["started"])[:self.MAX_LISTED]
+        update_status(self.job_id, in_flight=[
+            {**{key: value for key, value in entry.items() if key != "started"},
+             "elapsed": round(now - entry["started"], 1)}
+            for entry in listed
+        ])
+
+
+# 현재 작업의 InFlightRequests (워커 스레드에는 contextvars.copy_context()로 전달)
+_in_flight_requests = contextvars.ContextVar("in_flight_requests", default=None)
 
 
 def update_heartbeat():
@@ -219,36 +350,278 @@ def check_heartbeat_timeout():
                 break
 
 
-# Gemini API 설정 (환경변수에서 API 키 가져오기) - 지연 로드
-gemini_model = None
-gemini_model_error = None
+# LLM 백엔드 (TRANSLATION_MODE에 따라 Gemini 또는 Ollama) - 지연 로드
+llm_backend = None
+llm_backend_error = None
+llm_backend_lock = Lock()
 
 
-def get_gemini_model():
-    """Gemini 모델을 필요할 때만 로드"""
-    global gemini_model, gemini_model_error
-    if gemini_model is not None:
-        return gemini_model
-    if gemini_model_error:
+def get_llm_backend():
+    """설정된 LLM 백엔드를 필요할 때만 생성 (실패 시 None, 원인은 llm_backend_error)"""
+    global llm_backend, llm_backend_error
+    if llm_backend is not None:
+        return llm_backend
+    if llm_backend_error:
         return None
 
+    with llm_backend_lock:
+        if llm_backend is not None or llm_backend_error:
+            return llm_backend
+        try:
+            from llm_backends import create_backend
+
+            llm_backend = create_backend(
+                TRANSLATION_MODE,
+                gemini_api_key=os.environ.get("GEMINI_API_KEY"),
+                gemini_model=GEMINI_MODEL_NAME,
+                ollama_url=OLLAMA_URL,
+                ollama_model=OLLAMA_MODEL,
+                timeout=LLM_REQUEST_TIMEOUT,
+                pool_size=GEMINI_MAX_INFLIGHT,
+            )
+            logger.info(f"LLM backend initialized: {llm_backend.name} ({llm_backend.model_name})")
+        except Exception as e:
+            llm_backend_error = str(e)
+            logger.error(f"Failed to initialize LLM backend ({TRANSLATION_MODE}): {e}")
+
+    return llm_backend
+
+
+# LLM 워밍업 상태 (/health의 llm_ready): pending -> warming -> ready / error
+# prewarm/keep-alive/번역 스레드가 함께 바꾸므로 llm_warmup_lock 아래에서만 읽고 씀
+llm_warmup = {"state": "pending", "error": None, "seconds": None}
+llm_warmup_lock = Lock()
+# 마지막 LLM 호출(워밍업 포함)과 마지막 실제 번역 요청 시각 (서버 시작 시각에서 출발)
+llm_last_used = 0.0
+llm_last_request = time.monotonic()
+
+
+def get_llm_warmup() -> dict:
+    with llm_warmup_lock:
+        return dict(llm_warmup)
+
+
+def set_llm_warmup(only_if_not_ready: bool = False, **fields) -> None:
+    """워밍업 상태 갱신. only_if_not_ready면 이미 ready일 때는 그대로 둠"""
+    with llm_warmup_lock:
+        if not (only_if_not_ready and llm_warmup["state"] == "ready"):
+            llm_warmup.update(fields)
+
+
+def warm_up_llm() -> bool:
+    """백엔드를 만들고 가벼운 호출로 연결(TLS/keep-alive)과 모델을 준비"""
+    global llm_last_used
+    backend = get_llm_backend()
+    if not backend:
+        set_llm_warmup(state="error", error=llm_backend_error)
+        return False
+    set_llm_warmup(only_if_not_ready=True, state="warming")
+    started = time.perf_counter()
     try:
-        import google.generativeai as genai
+        backend.warm_up()
+    except Exception as exc:
+        set_llm_warmup(state="error", error=f"{type(exc).__name__}: {exc}")
+        logger.warning(f"LLM warm-up failed: {exc}")
+        return False
+    set_llm_warmup(state="ready", error=None, seconds=round(time.perf_counter() - started, 3))
+    llm_last_used = time.monotonic()
+    return True
 
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            gemini_model_error = "GEMINI_API_KEY not set"
-            logger.warning("[Warning] GEMINI_API_KEY not set")
-            return None
 
-        genai.configure(api_key=api_key)
-        gemini_model = genai.GenerativeModel("gemini-2.5-flash")
-        logger.info("Gemini API initialized with model: gemini-2.5-flash")
-    except Exception as e:
-        gemini_model_error = str(e)
-        logger.error(f"Failed to initialize Gemini API: {e}")
+def llm_keepalive_wanted() -> bool:
+    """대기/실행 중인 작업이 있거나 마지막 번역 요청 후 LLM_KEEPALIVE_MAX_IDLE이 지나지 않았으면 유지"""
+    counts = job_registry.counts()
+    if counts.get("queued") or counts.get("processing"):
+        return True
+    return LLM_KEEPALIVE_MAX_IDLE <= 0 or time.monotonic() - llm_last_request < LLM_KEEPALIVE_MAX_IDLE
+
+
+def llm_keepalive_loop() -> None:
+    """유휴 시간이 LLM_KEEPALIVE_INTERVAL을 넘으면 다시 워밍업해 연결과 모델을 살려 둠
+
+    오래 쓰지 않는 서버는 워밍업을 쉬고(Gemini 호출, Ollama 모델 상주 방지), 새 작업이 LLM을
+    쓰면 llm_last_request가 갱신되어 다시 유지한다.
+    """
+    paused = False
+    while not shutdown_flag:
+        idle = time.monotonic() - llm_last_used
+        if idle < LLM_KEEPALIVE_INTERVAL:
+            time.sleep(LLM_KEEPALIVE_INTERVAL - idle)
+            continue
+        if not llm_keepalive_wanted():
+            if not paused:
+                logger.info("LLM keep-alive paused (no jobs)")
+                paused = True
+            time.sleep(LLM_KEEPALIVE_INTERVAL)
+            continue
+        paused = False
+        if not warm_up_llm():
+            time.sleep(LLM_KEEPALIVE_INTERVAL)
+
+
+def get_model_name() -> str:
+    """번역 메모리 키에 쓰는 모델 이름"""
+    return OLLAMA_MODEL if TRANSLATION_MODE == "ollama" else GEMINI_MODEL_NAME
+
+
+translation_memory = None
+translation_memory_lock = Lock()
+
+
+def get_translation_memory():
+    """번역 메모리를 필요할 때만 연다 (비활성화/초기화 실패 시 None)"""
+    global translation_memory, TRANSLATION_CACHE_ENABLED
+    if not TRANSLATION_CACHE_ENABLED:
+        return None
+    with translation_memory_lock:
+        if translation_memory is None:
+            try:
+                from translation_memory import TranslationMemory
+
+                translation_memory = TranslationMemory(
+                    DATA_DIR / "translation_memory.sqlite3",
+                    max_entries=TRANSLATION_CACHE_MAX_ENTRIES,
+                    max_age_days=TRANSLATION_CACHE_MAX_AGE_DAYS,
+                )
+                logger.info(f"Translation memory opened: {translation_memory.db_path}")
+            except Exception as exc:
+                TRANSLATION_CACHE_ENABLED = False
+                logger.error(f"Failed to open translation memory, caching disabled: {exc}")
+                return None
+    return translation_memory
+
+
+glossary = None
+glossary_checked = False
+glossary_lock = Lock()
+
+
+def glossary_path() -> Path | None:
+    if GLOSSARY_FILE:
+        return Path(GLOSSARY_FILE).expanduser()
+    for suffix in GLOSSARY_EXTENSIONS:
+        path = DATA_DIR / f"glossary{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def get_glossary():
+    """용어집을 처음 필요할 때 한 번만 읽어 매처를 빌드 (파일이 없거나 읽기 실패 시 None)"""
+    global glossary, glossary_checked
+    if glossary_checked:
+        return glossary
+    with glossary_lock:
+        if not glossary_checked:
+            path = glossary_path()
+            if path is not None and path.exists():
+                try:
+                    from glossary import Glossary
+
+                    glossary = Glossary.load(path)
+                    logger.info(f"Glossary loaded: {path} ({len(glossary)} terms)")
+                except Exception as exc:
+                    logger.error(f"Failed to load glossary {path}: {exc}")
+            glossary_checked = True
+    return glossary
+
+
+def glossary_terms(text: str) -> list[tuple[str, str]]:
+    current = get_glossary()
+    return current.find_terms(text) if current else []
+
 
-    return gemini_model
+def cache_prompt_version(text: str) -> str:
+    """번역 메모리 키의 프롬프트 버전: 용어가 걸린 셀은 그 용어들의 태그를 붙여 용어집 변경 시 다시 번역"""
+    current = get_glossary()
+    tag = current.cache_tag(current.find_terms(text)) if current else ""
+    return f"{PROMPT_VERSION}+{tag}" if tag else PROMPT_VERSION
+
+
+def lookup_translation_memory(texts, context: str) -> dict[str, str]:
+    memory = get_translation_memory()
+    if not memory:
+        return {}
+    try:
+        by_version = {}
+        for text in texts:
+            by_version.setdefault(cache_prompt_version(text), []).append(text)
+        found = {}
+        for version, version_texts in by_version.items():
+            found.update(memory.get_many(version_texts, context, version, get_model_name()))
+    except Exception as exc:
+        logger.warning(f"Translation memory lookup failed: {exc}")
+        return {}
+    misses = len(set(texts)) - len(found)
+    cache_lookups_total.inc(len(found), result="hit")
+    cache_lookups_total.inc(misses, result="miss")
+    job_metrics = metrics.current_job_metrics()
+    if job_metrics is not None:
+        job_metrics.add(cache_hits=len(found), cache_misses=misses)
+    return found
+
+
+def store_translation_memory(pairs, context: str) -> None:
+    memory = get_translation_memory()
+    if not memory:
+        return
+    try:
+        by_version = {}
+        for text, translated in pairs:
+            by_version.setdefault(cache_prompt_version(text), []).append((text, translated))
+        for version, version_pairs in by_version.items():
+            memory.put_many(version_pairs, context, version, get_model_name())
+    except Exception as exc:
+        logger.warning(f"Translation memory update failed: {exc}")
+
+
+llm_throttle = LLMThrottle(
+    requests_per_minute=GEMINI_RPM,
+    tokens_per_minute=GEMINI_TPM,
+    min_concurrency=GEMINI_MIN_INFLIGHT,
+    max_concurrency=GEMINI_MAX_INFLIGHT,
+    quota_pause=GEMINI_RETRY_BACKOFF,
+)
+
+# 성능 지표 (/metrics). 작업별 요약은 metrics.current_job_metrics()에 함께 누적
+metrics_registry = metrics.MetricsRegistry(prefix="translator_")
+llm_request_seconds = metrics_registry.histogram(
+    "llm_request_duration_seconds", "LLM request latency per attempt", ("backend", "outcome")
+)
+llm_requests_total = metrics_registry.counter("llm_requests_total", "LLM request attempts", ("backend", "outcome"))
+llm_retries_total = metrics_registry.counter("llm_retries_total", "LLM request retries", ("backend",))
+llm_chars_total = metrics_registry.counter("llm_chars_total", "Characters sent to/received from the LLM", ("direction",))
+llm_tokens_total = metrics_registry.counter(
+    "llm_estimated_tokens_total", "Estimated tokens sent to/received from the LLM", ("direction",)
+)
+llm_stream_timeouts_total = metrics_registry.counter(
+    "llm_stream_timeouts_total", "Streaming LLM requests cancelled by first-token/stall timeout", ("backend", "phase")
+)
+glossary_checks_total = metrics_registry.counter(
+    "glossary_checks_total", "Translations checked against glossary terms", ("result",)
+)
+cache_lookups_total = metrics_registry.counter(
+    "translation_memory_lookups_total", "Translation memory lookups by result", ("result",)
+)
+workbook_seconds = metrics_registry.histogram(
+    "workbook_duration_seconds", "Workbook load/save duration", ("operation",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+jobs_total = metrics_registry.counter("jobs_finished_total", "Finished translation jobs", ("status",))
+job_seconds = metrics_registry.histogram(
+    "job_duration_seconds", "Translation job duration", buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+)
+metrics_registry.gauge(
+    "jobs", "Jobs in the queue registry by state", ("state",),
+    callback=lambda: {(state,): count for state, count in job_registry.counts().items()},
+)
+metrics_registry.gauge(
+    "llm_concurrency_limit", "Current adaptive LLM concurrency limit",
+    callback=lambda: llm_throttle.stats()["concurrency_limit"],
+)
+metrics_registry.gauge(
+    "llm_in_flight", "LLM requests currently in flight", callback=lambda: llm_throttle.stats()["in_flight"],
+)
 
 
 def is_allowed_file(filename: str) -> bool:
@@ -286,191 +659,1030 @@ def is_retryable_exception(exc: Exception) -> bool:
     return any(term in message for term in retry_terms)
 
 
+def is_quota_exception(exc: Exception) -> bool:
+    """429/할당량 초과 여부 (전역 속도 조절 대상)"""
+    try:
+        from google.api_core import exceptions as gexc
+
+        if isinstance(exc, gexc.ResourceExhausted):
+            return True
+    except Exception:
+        pass
+
+    message = str(exc).lower()
+    return any(term in message for term in ("rate limit", "quota", "429", "resource exhausted"))
+
+
+def extract_batch_archive(stream, job_dir: Path, start_index: int, budget: list[int]) -> list[tuple[str, str]]:
+    """업로드된 zip에서 .xlsx만 작업 폴더로 풀어 (저장 이름, 원래 이름) 목록 반환
+
+    폴더 구조는 무시하고, 숨김/임시 파일(__MACOSX, ~$...)은 건너뛴다. budget[0]은 남은 압축 해제
+    바이트 수로, 넘으면 ValueError (zip 폭탄 방지). 손상/암호화된 zip도 ValueError.
+    """
+    import shutil
+    import zipfile
+    import zlib
+
+    extracted = []
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            for info in archive.infolist():
+                name = info.filename
+                if not info.flag_bits & 0x800:
+                    # UTF-8 플래그가 없는 zip(윈도우 탐색기 등)의 한글 이름은 cp949로 다시 해석
+                    try:
+                        name = name.encode("cp437").decode("cp949")
+                    except (UnicodeEncodeError, UnicodeDecodeError):
+                        pass
+                base = name.replace("\\", "/").rsplit("/", 1)[-1]
+                if info.is_dir() or name.startswith("__MACOSX/") or base.startswith(("~$", ".")) \
+                        or not is_allowed_file(base):
+                    continue
+                if info.file_size > budget[0]:
+                    raise ValueError("압축 해제 용량 한도를 넘었습니다.")
+                budget[0] -= info.file_size
+                stored_name = f"input_{start_index + len(extracted):04d}.xlsx"
+                with archive.open(info) as src, open(job_dir / stored_name, "wb") as dst:
+                    # ZipExtFile은 헤더의 file_size까지만 풀어 주므로 위의 budget 검사로 총량이 제한됨
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                extracted.append((stored_name, base))
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, RuntimeError, NotImplementedError, EOFError, zlib.error) as exc:
+        # 손상된 zip, 암호가 걸린 항목(RuntimeError), 지원하지 않는 압축 방식(NotImplementedError)
+        raise ValueError("올바른 zip 파일이 아닙니다.") from exc
+    return extracted
+
+
 def safe_unlink(path: Path) -> None:
     try:
         path.unlink(missing_ok=True)
     except Exception as exc:
         logger.warning(f"Failed to delete file: {path} ({exc})")
 
-def translate_with_llm(text, context=""):
-    """LLM을 사용하여 테스트 케이스를 전문적으로 번역"""
-    if not text or not isinstance(text, str) or not text.strip():
-        return text
-
-    model = get_gemini_model()  # 필요할 때 로드
-    if not model:
-        raise RuntimeError("Gemini API model not initialized - check API key")
-    
-    prompt = f"""You are a senior QA engineer with 30 years of experience in software testing and mobile app testing. 
-You are an expert in translating test cases from Korean to English while maintaining technical accuracy and clarity.
+TRANSLATOR_PERSONA = """You are a senior QA engineer with 30 years of experience in software testing and mobile app testing. 
+You are an expert in translating test cases from Korean to English while maintaining technical accuracy and clarity."""
 
-Translate the following Korean test case text to English. Keep the translation:
-- Professional and technically accurate
+TRANSLATION_GUIDELINES = """- Professional and technically accurate
 - Clear and concise
 - Using proper QA/testing terminology
 - Maintaining the original meaning and intent
-- Preserving line breaks and formatting
+- Preserving line breaks and formatting"""
 
-{f'Context: {context}' if context else ''}
 
+def format_glossary(terms: list[tuple[str, str]]) -> str:
+    """프롬프트에 넣을 용어집 부분 (해당 텍스트에 등장하는 용어만, 최대 GLOSSARY_MAX_TERMS개)"""
+    if not terms:
+        return ""
+    lines = "\n".join(f"- {source} => {target}" for source, target in terms[:GLOSSARY_MAX_TERMS])
+    return f"\nAlways translate these terms exactly as given (glossary):\n{lines}\n"
+
+
+def build_translation_prompt(text: str, context: str = "") -> str:
+    return f"""{TRANSLATOR_PERSONA}
+
+Translate the following Korean test case text to English. Keep the translation:
+{TRANSLATION_GUIDELINES}
+
+{f'Context: {context}' if context else ''}
+{format_glossary(glossary_terms(text))}
 Korean text to translate:
 {text}
 
 Provide ONLY the English translation without any additional explanation or comments."""
 
+
+def build_batch_translation_prompt(items: list[tuple[str, str]], context: str = "") -> str:
+    payload = json.dumps([{"id": item_id, "text": text} for item_id, text in items], ensure_ascii=False)
+    terms = list(dict.fromkeys(term for _, text in items for term in glossary_terms(text)))
+    return f"""{TRANSLATOR_PERSONA}
+
+Translate each Korean test case text in the JSON array below to English. Keep every translation:
+{TRANSLATION_GUIDELINES}
+
+{f'Context: {context}' if context else ''}
+{format_glossary(terms)}
+Korean texts to translate (JSON array of objects with "id" and "text"):
+{payload}
+
+Respond with ONLY a JSON array containing exactly one object per input item, in the form
+[{{"id": "<same id as input>", "translation": "<English translation>"}}].
+Do not merge, split, skip or reorder items, and encode line breaks inside translations as \\n."""
+
+
+def generate_text(backend, prompt: str, json_mode: bool = False, on_chunk=None) -> str:
+    """백엔드 호출. 스트리밍을 지원하면 조각을 모으며 on_chunk(받은 글자 수)로 진행을 알리고,
+    첫 토큰/조각 사이 제한 시간을 넘기면 LLMStreamTimeout
+    """
+    if not (LLM_STREAMING and getattr(backend, "supports_streaming", False)):
+        return backend.generate(prompt, json_mode=json_mode)
+    pieces = []
+    received = 0
+    for piece in backend.generate_stream(
+        prompt,
+        json_mode=json_mode,
+        first_token_timeout=LLM_FIRST_TOKEN_TIMEOUT or None,
+        stall_timeout=LLM_STALL_TIMEOUT or None,
+    ):
+        pieces.append(piece)
+        received += len(piece)
+        if on_chunk is not None:
+            on_chunk(received)
+    return "".join(pieces)
+
+
+def generate_with_retry(prompt: str, json_mode: bool = False, cells: list[str] | None = None,
+                        context: str = "") -> str:
+    """모델 호출 + 재시도 (재시도 가능한 오류와 스트림 제한 시간 초과는 지수 백오프 후 재시도)
+
+    cells(요청에 담긴 셀 원문)가 주어지면 작업 상태의 in_flight에 요청 진행 상황을 표시한다.
+    """
+    tracker = _in_flight_requests.get()
+    if tracker is None or not cells:
+        return _generate_with_retry(prompt, json_mode)
+    request_id = tracker.start(cells, context)
+    try:
+        return _generate_with_retry(prompt, json_mode, tracker, request_id)
+    finally:
+        tracker.finish(request_id)
+
+
+def _generate_with_retry(prompt: str, json_mode: bool = False, tracker=None, request_id: int = 0) -> str:
+    global llm_last_used, llm_last_request
+    backend = get_llm_backend()  # 필요할 때 로드
+    if not backend:
+        raise RuntimeError(f"LLM backend not initialized - {llm_backend_error}")
+
+    from llm_backends import LLMStreamTimeout
+    from text_segments import estimate_tokens
+
+    # 입력 + (비슷한 길이의) 출력 토큰을 분당 토큰 버킷에서 미리 차감
+    input_tokens = estimate_tokens(prompt)
+    token_cost = input_tokens * 2
+    job_metrics = metrics.current_job_metrics()
+    on_chunk = (lambda received: tracker.update(request_id, chars=received)) if tracker is not None else None
     last_error = None
     for attempt in range(1, GEMINI_MAX_RETRIES + 1):
+        llm_throttle.acquire(token_cost)
+        if tracker is not None:
+            tracker.update(request_id, state="generating", attempt=attempt, chars=0, started=time.monotonic())
+        started = time.perf_counter()
         try:
-            logger.debug(f"Translating text ({len(text)} chars, {len(text.split())} words)")
-            response = model.generate_content(prompt)
-
-            translated = response.text.strip() if response and hasattr(response, "text") else ""
-            if not translated:
+            text = (generate_text(backend, prompt, json_mode=json_mode, on_chunk=on_chunk) or "").strip()
+            if not text:
                 raise RuntimeError("API returned empty or invalid response")
-
-            logger.debug(f"Translation completed ({len(translated)} chars)")
-            return translated
         except Exception as exc:
+            # 할당량 오류는 전역 동시성 한도를 줄이고 모든 워커를 잠시 멈춤
+            throttled = is_quota_exception(exc)
+            stalled = isinstance(exc, LLMStreamTimeout)
+            if stalled and exc.pending is not None:
+                # 끊지 못한 호출은 실제로 끝날 때까지 동시성 슬롯을 차지함 (한도는 늘리지 않음)
+                exc.pending.add_done_callback(lambda: llm_throttle.release(grow=False))
+            else:
+                llm_throttle.release(throttled=throttled, grow=not stalled)
+            outcome = "throttled" if throttled else "timeout" if stalled else "error"
+            llm_request_seconds.observe(time.perf_counter() - started, backend=backend.name, outcome=outcome)
+            llm_requests_total.inc(backend=backend.name, outcome=outcome)
+            if stalled:
+                llm_stream_timeouts_total.inc(backend=backend.name, phase=exc.phase)
+                if job_metrics is not None:
+                    job_metrics.add(stream_timeouts=1)
             last_error = exc
             if is_retryable_exception(exc) and attempt < GEMINI_MAX_RETRIES:
-                backoff = GEMINI_RETRY_BACKOFF * (2 ** (attempt - 1))
+                llm_retries_total.inc(backend=backend.name)
+                if job_metrics is not None:
+                    job_metrics.add(llm_errors=1, retries=1)
                 logger.warning(
                     f"Retryable translation error (attempt {attempt}/{GEMINI_MAX_RETRIES}): {exc}"
                 )
-                time.sleep(backoff)
+                if tracker is not None:
+                    tracker.update(request_id, state="retrying")
+                # 멈춘 스트림도 서버가 느리다는 신호이므로 다른 오류와 같이 백오프 후 재시도
+                time.sleep(backoff_with_jitter(GEMINI_RETRY_BACKOFF, attempt))
                 continue
+            if job_metrics is not None:
+                job_metrics.add(llm_errors=1)
             raise
 
+        llm_throttle.release()
+        llm_last_used = llm_last_request = time.monotonic()
+        set_llm_warmup(only_if_not_ready=True, state="ready", error=None)
+        elapsed = time.perf_counter() - started
+        output_tokens = estimate_tokens(text)
+        llm_request_seconds.observe(elapsed, backend=backend.name, outcome="ok")
+        llm_requests_total.inc(backend=backend.name, outcome="ok")
+        llm_chars_total.inc(len(prompt), direction="input")
+        llm_chars_total.inc(len(text), direction="output")
+        llm_tokens_total.inc(input_tokens, direction="input")
+        llm_tokens_total.inc(output_tokens, direction="output")
+        if job_metrics is not None:
+            job_metrics.observe_latency(elapsed)
+            job_metrics.add(
+                llm_calls=1,
+                input_chars=len(prompt),
+                output_chars=len(text),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+            )
+        return text
+
     raise last_error
 
-def process_excel_translation(input_file: Path, output_file: Path, job_id: str) -> None:
-    """엑셀 파일을 읽어 Steps와 Expected Result 열을 번역"""
+
+def check_glossary(text: str, translated: str) -> list[tuple[str, str]]:
+    """번역문에 용어집 target이 빠진 용어 목록 (용어가 없으면 빈 목록), 지표에 결과 기록"""
+    terms = glossary_terms(text)
+    if not terms:
+        return []
+    from glossary import Glossary
+
+    missing = Glossary.missing_terms(terms, translated)
+    glossary_checks_total.inc(result="miss" if missing else "ok")
+    if missing:
+        job_metrics = metrics.current_job_metrics()
+        if job_metrics is not None:
+            job_metrics.add(glossary_misses=1)
+    return missing
+
+
+def _translate_uncached(text: str, context: str) -> str:
+    logger.debug(f"Translating text ({len(text)} chars, {len(text.split())} words)")
+    translated = generate_with_retry(build_translation_prompt(text, context), cells=[text], context=context)
+    logger.debug(f"Translation completed ({len(translated)} chars)")
+    missing = check_glossary(text, translated)
+    if missing:
+        logger.warning("Glossary terms not used in translation: " + ", ".join(f"{s} => {t}" for s, t in missing))
+    store_translation_memory([(text, translated)], context)
+    return translated
+
+
+def should_segment(context: str) -> bool:
+    if TRANSLATION_SEGMENT_MODE == "all":
+        return True
+    if TRANSLATION_SEGMENT_MODE == "steps":
+        return context == "Test Steps"
+    return False
+
+
+def translate_with_llm(text, context="", segmented=None):
+    """LLM을 사용하여 테스트 케이스를 전문적으로 번역 (번역 메모리 우선 조회)
+
+    segmented가 참이면(기본값은 TRANSLATION_SEGMENT_MODE 설정을 따름) 번호 매긴 줄 단위로
+    나눠 캐시에 없는 줄만 모델에 보내고, 원래 번호와 줄바꿈대로 다시 조립한다.
+    """
+    if not text or not isinstance(text, str) or not text.strip():
+        return text
+
+    from text_segments import estimate_tokens, has_untranslated_mix, needs_translation
+
+    if TRANSLATION_SKIP_NON_KOREAN and not needs_translation(text, TRANSLATION_HANGUL_THRESHOLD):
+        return text
+    if TRANSLATION_KOREAN_SPANS_ONLY and has_untranslated_mix(text):
+        return translate_unique_texts([(text, context)])[(text, context)]
+
+    # 예산을 넘는 긴 셀은 조각으로 나눠 워커 풀에서 동시에 번역한 뒤 재조립
+    if TRANSLATION_CHUNK_TOKENS and estimate_tokens(text) > TRANSLATION_CHUNK_TOKENS:
+        return translate_unique_texts([(text, context)])[(text, context)]
+
+    if segmented is None:
+        segmented = should_segment(context)
+    if segmented:
+        from text_segments import split_step_lines, join_step_lines, segment_bodies
+
+        parts = split_step_lines(text)
+        bodies = segment_bodies(parts)
+        translated = translate_batch_with_llm([(str(idx), body) for idx, body in enumerate(bodies)], context)
+        return join_step_lines(parts, {body: translated[str(idx)] for idx, body in enumerate(bodies)})
+
+    cached = lookup_translation_memory([text], context).get(text)
+    if cached is not None:
+        return cached
+    return _translate_uncached(text, context)
+
+
+def make_batches(
+    items: list[tuple[str, str]],
+    max_items: int | None = None,
+    max_chars: int | None = None,
+) -> list[list[tuple[str, str]]]:
+    """(id, text) 목록을 항목 수/문자 수 예산 안에서 순서대로 묶음 (예산보다 긴 셀은 단독 배치)"""
+    max_items = max_items or TRANSLATION_BATCH_MAX_ITEMS
+    max_chars = max_chars or TRANSLATION_BATCH_MAX_CHARS
+    batches = []
+    current = []
+    current_chars = 0
+    for item in items:
+        size = len(item[1])
+        if current and (len(current) >= max_items or current_chars + size > max_chars):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(raw: str, expected_ids) -> dict[str, str]:
+    """배치 응답(JSON)을 id -> 번역으로 변환. 요청에 없거나 형식이 잘못된 항목은 버림"""
+    text = raw.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+
     try:
-        from openpyxl import load_workbook
+        data = json.loads(text)
+    except ValueError:
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            return {}
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+
+    if isinstance(data, dict):
+        data = data.get("translations", data)
+    if isinstance(data, dict):
+        data = [{"id": key, "translation": value} for key, value in data.items()]
+    if not isinstance(data, list):
+        return {}
+
+    expected = set(expected_ids)
+    results = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        item_id = str(entry.get("id", ""))
+        translation = entry.get("translation")
+        if item_id in expected and item_id not in results and isinstance(translation, str) and translation.strip():
+            results[item_id] = translation.strip()
+    return results
+
+
+def translate_batch_with_llm(items: list[tuple[str, str]], context: str = "", on_error=None) -> dict[str, str]:
+    """여러 셀을 한 번의 요청으로 번역하고, 응답에서 누락/손상된 항목은 셀 단위 번역으로 대체
+
+    배치 요청 자체가 (재시도 끝에) 실패하면 셀마다 다시 요청하지 않고 그 오류를 모든 셀의 실패로
+    처리한다 (할당량 초과 등 오류가 몰릴 때 요청 수가 셀 수 x 재시도 횟수로 불어나지 않도록).
+    on_error(text, exc)가 주어지면 실패한 셀은 그 반환값을 결과로 사용하고, 없으면 예외를 그대로 전파한다.
+    """
+    cached = lookup_translation_memory([text for _, text in items], context)
+    results = {item_id: cached[text] for item_id, text in items if text in cached}
+    pending = [(item_id, text) for item_id, text in items if item_id not in results]
+
+    if len(pending) > 1:
+        batch_results = {}
+        try:
+            raw = generate_with_retry(
+                build_batch_translation_prompt(pending, context),
+                json_mode=True,
+                cells=[text for _, text in pending],
+                context=context,
+            )
+            batch_results = parse_batch_response(raw, [item_id for item_id, _ in pending])
+        except Exception as exc:
+            kind = "quota exhausted" if is_quota_exception(exc) else "failed"
+            logger.warning(f"Batch translation {kind} ({len(pending)} cells), not retrying per cell: {exc}")
+            if on_error is None:
+                raise
+            results.update((item_id, on_error(text, exc)) for item_id, text in pending)
+            return results
+
+        missing = len(pending) - len(batch_results)
+        if missing and batch_results:
+            logger.warning(f"Batch response missing {missing}/{len(pending)} entries, retrying them per cell")
+        # 용어집을 지키지 않은 항목은 셀 단위로 한 번 더 요청 (셀 단위 결과는 그대로 사용)
+        violations = [
+            item_id for item_id, text in pending
+            if item_id in batch_results and check_glossary(text, batch_results[item_id])
+        ]
+        if violations:
+            logger.warning(f"{len(violations)} batch translation(s) ignored glossary terms, retrying them per cell")
+            for item_id in violations:
+                del batch_results[item_id]
+        results.update(batch_results)
+        store_translation_memory(
+            [(text, batch_results[item_id]) for item_id, text in pending if item_id in batch_results],
+            context,
+        )
 
-        update_status(status="processing", error=None, started_at=datetime.utcnow().isoformat())
-        logger.info(f"[{job_id}] Starting translation process for: {input_file.name}")
+    for item_id, text in pending:
+        if item_id in results:
+            continue
+        try:
+            results[item_id] = _translate_uncached(text, context)
+        except Exception as exc:
+            if on_error is None:
+                raise
+            results[item_id] = on_error(text, exc)
+    return results
+
+def translate_unique_texts(keys, on_translated=None, on_error=None, job_id: str = "") -> dict:
+    """고유한 (text, context) 목록을 워커 풀에서 배치로 번역
+
+    분할 대상 context의 셀은 줄 body 단위로 쪼개 모든 셀에 걸쳐 중복을 제거한 뒤 요청하고,
+    셀 하나의 줄이 모두 번역되면 재조립한다. 추정 토큰 수가 TRANSLATION_CHUNK_TOKENS를 넘는
+    셀(또는 줄)은 줄/문장 경계에서 여러 조각으로 나눠 따로 요청하므로 여러 워커가 동시에 처리한다.
+    한글이 없는 셀은 요청 없이 원문 그대로 완료 처리하고(TRANSLATION_SKIP_NON_KOREAN),
+    TRANSLATION_KOREAN_SPANS_ONLY면 섞인 셀에서 한글이 있는 줄만 번역한다.
+    on_translated(key, translated)는 셀이 완성될 때마다 호출 스레드에서 불리며, on_error는
+    translate_batch_with_llm에 그대로 전달된다.
+    반환: (text, context) -> 번역문
+    """
+    from text_segments import (
+        chunk_text, has_hangul, has_untranslated_mix, join_chunks, join_step_lines, needs_translation,
+        segment_bodies, split_step_lines,
+    )
 
-        wb = load_workbook(input_file)
-        ws = wb.active
+    # 요청 단위(unit): 분할 모드면 줄 body, 아니면 셀 전체 (예산을 넘으면 그 조각)
+    unit_index = {}
+    units = []
+    waiting = []
+    layouts = []
+    remaining = []
+    chunked_cells = 0
+    chunk_units = set()
+    passthrough = []
+    for key_idx, (text, context) in enumerate(keys):
+        if TRANSLATION_SKIP_NON_KOREAN and not needs_translation(text, TRANSLATION_HANGUL_THRESHOLD):
+            layouts.append(None)
+            remaining.append(0)
+            passthrough.append(key_idx)
+            continue
+        spans_only = TRANSLATION_KOREAN_SPANS_ONLY and has_untranslated_mix(text)
+        parts = split_step_lines(text) if should_segment(context) or spans_only else None
+        bodies = segment_bodies(parts) if parts is not None else [text]
+        body_chunks = {body: chunk_text(body, TRANSLATION_CHUNK_TOKENS) for body in bodies}
+        if any(len(chunks) > 1 for chunks in body_chunks.values()):
+            chunked_cells += 1
+            chunk_units.update(
+                (chunk.strip(), context) for chunks in body_chunks.values() if len(chunks) > 1 for chunk, _ in chunks
+            )
+        layouts.append((parts, body_chunks))
+        key_units = dict.fromkeys(
+            chunk.strip() if len(chunks) > 1 else chunk
+            for chunks in body_chunks.values() for chunk, _ in chunks
+            if chunk.strip() and (not spans_only or has_hangul(chunk))
+        )
+        remaining.append(len(key_units))
+        for unit in key_units:
+            uid = unit_index.get((unit, context))
+            if uid is None:
+                uid = unit_index[(unit, context)] = len(units)
+                units.append((unit, context))
+                waiting.append([])
+            waiting[uid].append(key_idx)
+
+    results = {}
+    unit_results = {}
+
+    def unit_result(unit: str, context: str) -> str:
+        # 요청하지 않은 단위(한글 없는 줄/조각)는 원문 그대로
+        uid = unit_index.get((unit, context))
+        return unit_results[uid] if uid is not None and uid in unit_results else unit
+
+    def complete(key_idx: int) -> None:
+        text, context = keys[key_idx]
+        if layouts[key_idx] is None:
+            translated = text
+        else:
+            parts, body_chunks = layouts[key_idx]
+            body_results = {}
+            for body, chunks in body_chunks.items():
+                if len(chunks) == 1:
+                    body_results[body] = unit_result(body, context)
+                else:
+                    body_results[body] = join_chunks(
+                        chunks,
+                        {chunk.strip(): unit_result(chunk.strip(), context) for chunk, _ in chunks if chunk.strip()},
+                    )
+            translated = body_results[text] if parts is None else join_step_lines(parts, body_results)
+        results[keys[key_idx]] = translated
+        if on_translated:
+            on_translated(keys[key_idx], translated)
+
+    batches = []
+    for context in dict.fromkeys(context for _, context in units):
+        items = [
+            (str(uid), body) for uid, (body, unit_context) in enumerate(units)
+            if unit_context == context and (body, context) not in chunk_units
+        ]
+        batches.extend((context, batch) for batch in make_batches(items))
+        # 긴 셀의 조각은 하나씩 따로 요청해 여러 워커가 동시에 처리 (응답 길이도 조각 크기로 제한됨)
+        batches.extend(
+            (context, [(str(uid), body)]) for uid, (body, unit_context) in enumerate(units)
+            if unit_context == context and (body, context) in chunk_units
+        )
+    # 번역할 단위가 없는 셀(한글 없음)은 바로 완료
+    if passthrough:
+        logger.info(f"[{job_id}] {len(passthrough)} cell(s) without Korean text passed through unchanged")
+        job_metrics = metrics.current_job_metrics()
+        if job_metrics is not None:
+            job_metrics.add(cells_skipped=len(passthrough))
+    for key_idx, count in enumerate(remaining):
+        if count == 0:
+            complete(key_idx)
+    if not batches:
+        return results
+
+    workers = min(TRANSLATION_CONCURRENCY, len(batches))
+    logger.info(
+        f"[{job_id}] Translating {len(keys)} unique cells as {len(units)} request units "
+        f"in {len(batches)} batch(es) with {workers} worker(s)"
+        + (f", {chunked_cells} oversized cell(s) split into chunks" if chunked_cells else "")
+    )
 
-        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
-        if not header_row:
-            error_msg = "Header row not found"
-            logger.error(error_msg)
-            update_status(status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
+    # 워커 스레드는 번역만 수행하고, 결과 조립과 콜백은 이 스레드에서만 처리
+    # (openpyxl 워크시트는 스레드 안전하지 않음). 작업별 지표가 이어지도록 컨텍스트를 복사해 전달
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, translate_batch_with_llm, batch, context, on_error)
+            for context, batch in batches
+        ]
+        for future in as_completed(futures):
+            for item_id, translated in future.result().items():
+                uid = int(item_id)
+                unit_results[uid] = translated
+                for key_idx in waiting[uid]:
+                    remaining[key_idx] -= 1
+                    if remaining[key_idx] == 0:
+                        complete(key_idx)
+
+    return results
+
+
+def save_translated_workbook(input_file: Path, output_file: Path, translations: dict) -> None:
+    """원본을 바탕으로 번역문을 반영한 출력 파일 저장
+
+    기본은 번역된 셀만 xlsx zip 안에서 고쳐 쓰는 패치 writer. 패치할 수 없는 파일이면
+    큰 파일은 스트리밍 writer, 작은 파일은 전체 복사 writer로 저장한다.
+    """
+    from excel_io import PatchError, write_full_copy, write_patched_copy, write_streaming_copy
+
+    if EXCEL_PATCH_WRITER:
+        try:
+            write_patched_copy(input_file, output_file, translations)
             return
+        except PatchError as exc:
+            logger.warning(f"Patch writer unavailable for {Path(input_file).name}, using full save: {exc}")
 
-        steps_col = None
-        expected_result_col = None
-        for idx, col in enumerate(header_row, 1):
-            if col is None:
+    size_mb = Path(input_file).stat().st_size / (1024 * 1024)
+    if size_mb >= EXCEL_STREAMING_MIN_MB:
+        logger.info(f"Saving {output_file.name} with streaming writer ({size_mb:.1f} MB input)")
+        write_streaming_copy(input_file, output_file, translations)
+    else:
+        write_full_copy(input_file, output_file, translations)
+
+
+TRANSLATION_ERROR_PREFIX = "[Translation Error]"
+
+
+def collect_translation_tasks(input_file: Path, column_rules, job_id: str = "") -> tuple[list[tuple], dict]:
+    """모든 시트에서 번역 대상 셀 (sheet, row, column, text, context) 수집 (첫 행을 헤더로 사용)
+
+    반환: (셀 목록, 시트 이름 -> {열 번호: context})
+    """
+    from openpyxl import load_workbook
+    from excel_io import iter_sheet_rows, match_columns
+
+    def is_translatable(value) -> bool:
+        return isinstance(value, str) and value.strip()
+
+    # read-only 모드로 행을 지연 로드 (전체 워크북 객체를 메모리에 올리지 않음)
+    wb = load_workbook(input_file, read_only=True)
+    try:
+        tasks = []
+        sheet_columns = {}
+        for ws in wb.worksheets:
+            header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+            column_contexts = match_columns(header_row, column_rules)
+            if not column_contexts:
+                logger.info(f"[{job_id}] Sheet '{ws.title}': no columns to translate, skipped")
                 continue
-            col_lower = str(col).lower().strip()
-            if "steps" in col_lower:
-                steps_col = idx
-                logger.info(f"Found 'Steps' column at index {idx}")
-            if "expected" in col_lower and "result" in col_lower:
-                expected_result_col = idx
-                logger.info(f"Found 'Expected Result' column at index {idx}")
-
-        if not steps_col and not expected_result_col:
-            error_msg = "Steps or Expected Result column not found"
-            logger.error(error_msg)
-            update_status(status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
-            return
+            sheet_columns[ws.title] = column_contexts
+            logger.info(
+                f"[{job_id}] Sheet '{ws.title}': translating columns "
+                + ", ".join(f"{header_row[col - 1]!s} ({context})" for col, context in column_contexts.items())
+            )
+            for row_idx, row in iter_sheet_rows(ws, min_row=2):
+                for col, context in column_contexts.items():
+                    if col <= len(row) and is_translatable(row[col - 1]):
+                        tasks.append((ws.title, row_idx, col, row[col - 1], context))
+        return tasks, sheet_columns
+    finally:
+        wb.close()
 
-        logger.info(
-            f"Will translate columns - Steps: {steps_col}, Expected Result: {expected_result_col}"
-        )
 
-        def is_translatable(value) -> bool:
-            return isinstance(value, str) and value.strip()
+def resolve_column_rules(columns=None):
+    """업로드에서 지정한 열 목록(헤더 이름)이 있으면 그대로, 없으면 TRANSLATION_COLUMNS 규칙 사용"""
+    from excel_io import explicit_column_rules, parse_column_rules
+
+    if columns:
+        return explicit_column_rules(columns)
+    return parse_column_rules(TRANSLATION_COLUMNS)
+
+
+def process_excel_translation(
+    input_file: Path, output_file: Path, job_id: str, checkpoint_dir: Path | None = None, columns=None
+) -> None:
+    """엑셀 파일의 모든 시트에서 번역 대상 열(기본: Steps, Expected Result)을 번역
+
+    모든 시트의 셀을 모아 중복을 제거한 뒤 하나의 워커 풀에서 동시에 번역하며, 진행률은 전체 합계와
+    시트별(sheets)로 보고한다. columns(헤더 이름 목록)를 주면 그 열만 번역한다.
+    checkpoint_dir가 주어지면 완료된 번역을 저널에 기록하고, 이미 기록된 셀은 다시 번역하지 않는다.
+    이 경우 입력 파일은 작업 폴더에 있으며 작업이 성공했을 때만 폴더째 삭제된다.
+    """
+    translate_workbooks([(Path(input_file), Path(output_file), Path(input_file).name)], job_id,
+                        checkpoint_dir=checkpoint_dir, columns=columns)
 
-        total_cells = 0
-        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, values_only=True):
-            if steps_col and steps_col <= len(row) and is_translatable(row[steps_col - 1]):
-                total_cells += 1
-            if (
-                expected_result_col
-                and expected_result_col <= len(row)
-                and is_translatable(row[expected_result_col - 1])
-            ):
-                total_cells += 1
 
+def process_batch_translation(
+    inputs: list[tuple[Path, str]], archive_file: Path, job_id: str, checkpoint_dir: Path | None = None, columns=None
+) -> None:
+    """여러 엑셀 파일을 한 작업으로 번역하고 결과를 zip 하나로 묶음
+
+    inputs는 (입력 경로, 원래 파일 이름) 목록. 모든 파일의 셀을 한 번에 모아 중복 제거/번역 메모리
+    조회를 공유하므로 같은 문장이 여러 파일에 있어도 한 번만 번역한다. 개별 결과 파일은 작업 폴더
+    (없으면 임시 폴더)에 만든 뒤 archive_file로 묶는다.
+    """
+    import tempfile
+
+    work_dir = Path(checkpoint_dir) / "outputs" if checkpoint_dir is not None else Path(tempfile.mkdtemp())
+    work_dir.mkdir(parents=True, exist_ok=True)
+    documents = [
+        (Path(input_path), work_dir / f"{index:04d}.xlsx", source_name)
+        for index, (input_path, source_name) in enumerate(inputs)
+    ]
+    try:
+        translate_workbooks(documents, job_id, checkpoint_dir=checkpoint_dir, columns=columns,
+                            archive_file=Path(archive_file))
+    finally:
+        if checkpoint_dir is None:
+            import shutil
+
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def batch_output_name(source_name: str, used_names: set) -> str:
+    """zip 안에 넣을 결과 파일 이름 ("<원래 이름>_translated.xlsx", 겹치면 번호 추가)"""
+    stem = Path(source_name.replace("\\", "/")).stem or "workbook"
+    name = f"{stem}_translated.xlsx"
+    index = 2
+    while name.lower() in used_names:
+        name = f"{stem}_translated ({index}).xlsx"
+        index += 1
+    used_names.add(name.lower())
+    return name
+
+
+def write_output_archive(archive_file: Path, members: list[tuple[Path, str]]) -> None:
+    """결과 파일들을 zip으로 묶음 (xlsx는 이미 압축돼 있으므로 무압축 저장)"""
+    import zipfile
+
+    tmp_path = archive_file.with_name(archive_file.name + ".tmp")
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) as archive:
+        for path, name in members:
+            archive.write(path, name)
+    os.replace(tmp_path, archive_file)
+
+
+def translate_workbooks(documents: list[tuple[Path, Path, str]], job_id: str, checkpoint_dir: Path | None = None,
+                        columns=None, archive_file: Path | None = None) -> None:
+    """(입력, 출력, 표시 이름) 목록의 워크북을 한 작업으로 번역
+
+    파일이 하나면 진행률을 시트별(sheets)로, 여러 개면 파일별(files)로 보고한다. 여러 파일 중
+    읽을 수 없거나 번역할 열이 없는 파일은 건너뛰고(files에 error 표시) 나머지만 번역한다.
+    archive_file이 주어지면 결과 파일들을 zip 하나로 묶는다.
+    """
+    journal = None
+    completed = False
+    resumable = False
+    batch = len(documents) > 1
+    job_metrics = metrics.JobMetrics()
+    metrics_token = metrics.bind_job_metrics(job_metrics)
+    log_token = log_reader.bind_job_id(job_id)
+    in_flight_token = _in_flight_requests.set(InFlightRequests(job_id))
+    job_started = time.perf_counter()
+    try:
+        from checkpoint import CheckpointJournal, load_journal, write_manifest
+
+        update_status(job_id, status="processing", error=None, started_at=datetime.utcnow().isoformat())
+        if batch:
+            logger.info(f"[{job_id}] Starting batch translation of {len(documents)} workbooks")
+        else:
+            logger.info(f"[{job_id}] Starting translation process for: {documents[0][0].name}")
+
+        column_rules = resolve_column_rules(columns)
+        load_started = time.perf_counter()
+        # 진행률 그룹: 파일 하나면 시트, 여러 개면 파일
+        tasks = []
+        group_totals = {}
+        group_errors = {}
+        translations = {}
+        for doc_index, (input_file, _, name) in enumerate(documents):
+            try:
+                doc_tasks, sheet_columns = collect_translation_tasks(input_file, column_rules, job_id)
+            except Exception as exc:
+                if not batch:
+                    raise
+                group_errors[name] = f"{type(exc).__name__}: {exc}"
+                logger.error(f"[{job_id}] Skipping {name}: {group_errors[name]}")
+                continue
+            if not sheet_columns:
+                if batch:
+                    group_errors[name] = "Columns to translate not found"
+                    logger.warning(f"[{job_id}] Skipping {name}: no columns to translate")
+                continue
+            translations[doc_index] = {sheet: {} for sheet in sheet_columns}
+            for sheet, row_idx, col, text, context in doc_tasks:
+                group = doc_index if batch else sheet
+                tasks.append((doc_index, sheet, row_idx, col, text, context, group))
+                group_totals[group] = group_totals.get(group, 0) + 1
+        load_seconds = time.perf_counter() - load_started
+        workbook_seconds.observe(load_seconds, operation="load")
+        job_metrics.set_duration("workbook_load", load_seconds)
+
+        if not translations:
+            error_msg = "Columns to translate not found (" + ", ".join(context for context, _ in column_rules) + ")"
+            logger.error(error_msg)
+            update_status(job_id, status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
+            return
+
+        total_cells = len(tasks)
         if total_cells == 0:
             error_msg = "No translatable cells found"
             logger.error(error_msg)
-            update_status(status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
+            update_status(job_id, status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
             return
 
-        update_status(total=total_cells, current=0, progress=0, estimated_time=0)
+        # 동일한 (text, context)는 한 번만 번역하고 결과를 모든 셀에 나눠 씀
+        # (시트/파일이 달라도 같은 문장이면 한 번만 번역)
+        unique_groups = {}
+        for doc_index, sheet, row_idx, col, text, context, group in tasks:
+            unique_groups.setdefault((text, context), []).append((doc_index, sheet, row_idx, col, group))
+        del tasks
+        unique_keys = list(unique_groups)
+        unique_total = len(unique_keys)
+        logger.info(
+            f"[{job_id}] {total_cells} translatable cells in {len(group_totals)} {'file' if batch else 'sheet'}(s), "
+            f"{unique_total} unique ({total_cells - unique_total} duplicates skipped)"
+        )
+
+        # 이전 실행에서 저널에 남긴 번역은 그대로 재사용
+        restored = {}
+        if checkpoint_dir is not None:
+            journaled = load_journal(checkpoint_dir)
+            restored = {key: journaled[key] for key in unique_keys if key in journaled}
+            journal = CheckpointJournal(checkpoint_dir, fsync_interval=CHECKPOINT_FSYNC_INTERVAL)
+            write_manifest(checkpoint_dir, status="processing")
+            resumable = True
+            if restored:
+                logger.info(f"[{job_id}] Resuming from checkpoint: {len(restored)}/{unique_total} unique cells done")
+
+        group_current = dict.fromkeys(group_totals, 0)
+        group_field = "files" if batch else "sheets"
+
+        def group_progress() -> list[dict]:
+            progress = [
+                {"name": documents[group][2] if batch else group, "total": total, "current": group_current[group]}
+                for group, total in group_totals.items()
+            ]
+            progress.extend({"name": name, "total": 0, "current": 0, "error": error}
+                            for name, error in group_errors.items())
+            return progress
+
+        update_status(
+            job_id,
+            total=total_cells,
+            current=0,
+            unique_total=unique_total,
+            unique_current=0,
+            restored=len(restored),
+            progress=0,
+            estimated_time=0,
+            **{group_field: group_progress()},
+        )
+        if group_errors:
+            set_error_once(job_id, f"{len(group_errors)} file(s) skipped: " + ", ".join(group_errors))
         start_time = time.time()
 
-        translated_cells = 0
-        for row_idx in range(2, ws.max_row + 1):
-            if steps_col:
-                cell = ws.cell(row=row_idx, column=steps_col)
-                if is_translatable(cell.value):
-                    try:
-                        translated = translate_with_llm(cell.value, context="Test Steps")
-                    except Exception as exc:
-                        error_msg = f"{type(exc).__name__}: {exc}"
-                        logger.error(f"Translation failed: {error_msg}")
-                        set_error_once(error_msg)
-                        translated = f"[Translation Error] {cell.value}"
-                    cell.value = translated
-                    translated_cells += 1
-
-            if expected_result_col:
-                cell = ws.cell(row=row_idx, column=expected_result_col)
-                if is_translatable(cell.value):
-                    try:
-                        translated = translate_with_llm(cell.value, context="Expected Result")
-                    except Exception as exc:
-                        error_msg = f"{type(exc).__name__}: {exc}"
-                        logger.error(f"Translation failed: {error_msg}")
-                        set_error_once(error_msg)
-                        translated = f"[Translation Error] {cell.value}"
-                    cell.value = translated
-                    translated_cells += 1
-
-            if translated_cells:
-                progress = int((translated_cells / total_cells) * 100)
-                elapsed = time.time() - start_time
-                avg_time_per_cell = elapsed / translated_cells
-                remaining_cells = total_cells - translated_cells
-                estimated_time = int(avg_time_per_cell * remaining_cells)
-                update_status(
-                    current=translated_cells,
-                    progress=min(progress, 100),
-                    estimated_time=max(estimated_time, 0),
-                )
+        def on_cell_error(text: str, exc: Exception) -> str:
+            error_msg = f"{type(exc).__name__}: {exc}"
+            logger.error(f"Translation failed: {error_msg}")
+            set_error_once(job_id, error_msg)
+            return f"{TRANSLATION_ERROR_PREFIX} {text}"
 
-        wb.save(output_file)
-        wb.close()
+        translated_cells = 0
+        translated_unique = 0
+        last_metrics_update = 0.0
+
+        def on_translated(key, translated: str) -> None:
+            nonlocal translated_cells, translated_unique, last_metrics_update
+            for doc_index, sheet, row_idx, col, group in unique_groups[key]:
+                translations[doc_index][sheet][(row_idx, col)] = translated
+                group_current[group] += 1
+                translated_cells += 1
+            translated_unique += 1
+            if journal is not None and key not in restored and TRANSLATION_ERROR_PREFIX not in translated:
+                journal.record(key[0], key[1], translated)
+
+            # 남은 시간은 실제 요청 단위인 고유 셀 기준으로 추정 (체크포인트에서 복원한 셀 제외)
+            progress = int((translated_cells / total_cells) * 100)
+            elapsed = time.time() - start_time
+            avg_time_per_unique = elapsed / max(translated_unique - len(restored), 1)
+            remaining_unique = unique_total - translated_unique
+            estimated_time = int(avg_time_per_unique * remaining_unique)
+            update_status(
+                job_id,
+                current=translated_cells,
+                unique_current=translated_unique,
+                progress=min(progress, 100),
+                estimated_time=max(estimated_time, 0),
+                **{group_field: group_progress()},
+            )
+            # 지표 요약은 초당 한 번만 갱신 (셀마다 지연 시간 분위수를 다시 계산하지 않도록)
+            if time.time() - last_metrics_update >= 1.0:
+                last_metrics_update = time.time()
+                update_status(job_id, metrics=job_metrics.summary())
+
+        for key, translated in restored.items():
+            on_translated(key, translated)
+
+        pending_keys = [key for key in unique_keys if key not in restored]
+        translate_unique_texts(pending_keys, on_translated=on_translated, on_error=on_cell_error, job_id=job_id)
+
+        job_metrics.set_duration("translate", time.time() - start_time)
+        save_started = time.perf_counter()
+        for doc_index, doc_translations in translations.items():
+            input_file, output_file, _ = documents[doc_index]
+            save_translated_workbook(input_file, output_file, doc_translations)
+        if archive_file is not None:
+            used_names = set()
+            write_output_archive(archive_file, [
+                (documents[doc_index][1], batch_output_name(documents[doc_index][2], used_names))
+                for doc_index in translations
+            ])
+        save_seconds = time.perf_counter() - save_started
+        workbook_seconds.observe(save_seconds, operation="save")
+        job_metrics.set_duration("workbook_save", save_seconds)
+        job_metrics.set_duration("total", time.perf_counter() - job_started)
 
         update_status(
+            job_id,
             status="completed",
             progress=100,
             estimated_time=0,
             completed_at=datetime.utcnow().isoformat(),
+            metrics=job_metrics.summary(),
         )
-        logger.info(f"[{job_id}] Translation completed: {output_file.name}")
+        output_name = archive_file.name if archive_file is not None else documents[0][1].name
+        logger.info(f"[{job_id}] Translation completed: {output_name}")
+        completed = True
 
     except Exception as exc:
         import traceback
 
         error_msg = f"{type(exc).__name__}: {exc}"
-        update_status(status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
+        update_status(job_id, status="error", error=error_msg, completed_at=datetime.utcnow().isoformat())
         logger.error(f"Error in translation process: {error_msg}")
         logger.debug(traceback.format_exc())
+        if resumable:
+            write_manifest(checkpoint_dir, status="error", error=error_msg)
     finally:
-        safe_unlink(Path(input_file))
+        metrics.unbind_job_metrics(metrics_token)
+        _in_flight_requests.reset(in_flight_token)
+        update_status(job_id, in_flight=[])
+        job_elapsed = time.perf_counter() - job_started
+        job_seconds.observe(job_elapsed)
+        jobs_total.inc(status="completed" if completed else "error")
+        if not completed:
+            job_metrics.set_duration("total", job_elapsed)
+            update_status(job_id, metrics=job_metrics.summary())
+        if journal is not None:
+            journal.close()
+        if checkpoint_dir is None:
+            for input_file, _, _ in documents:
+                safe_unlink(Path(input_file))
+        elif completed or not resumable:
+            from checkpoint import remove_checkpoint
+
+            remove_checkpoint(checkpoint_dir)
+        log_reader.unbind_job_id(log_token)
+
+
+def run_translation_job(job_id: str, payload: dict) -> None:
+    if "documents" in payload:
+        # (입력, 출력, 이름) 목록을 그대로 번역 (CLI처럼 결과를 파일별 경로에 저장)
+        translate_workbooks(
+            payload["documents"], job_id, checkpoint_dir=payload.get("checkpoint_dir"), columns=payload.get("columns")
+        )
+        return
+    if "inputs" in payload:
+        process_batch_translation(
+            payload["inputs"],
+            payload["output_path"],
+            job_id,
+            checkpoint_dir=payload.get("checkpoint_dir"),
+            columns=payload.get("columns"),
+        )
+        return
+    process_excel_translation(
+        payload["input_path"],
+        payload["output_path"],
+        job_id,
+        checkpoint_dir=payload.get("checkpoint_dir"),
+        columns=payload.get("columns"),
+    )
+
+
+def resume_job(job_id: str) -> dict | None:
+    """체크포인트가 남아 있는 작업을 같은 job_id로 다시 큐에 넣음 (없으면 None)"""
+    from checkpoint import has_inputs, read_manifest
+
+    if not job_id or secure_filename(job_id) != job_id:
+        return None
+    job_dir = CHECKPOINT_FOLDER / job_id
+    manifest = read_manifest(job_dir)
+    if not manifest or not has_inputs(job_dir, manifest):
+        return None
+
+    current = job_registry.get(job_id)
+    if current and current["status"] in ("queued", "processing"):
+        return current
+
+    logger.info(f"[{job_id}] Resuming interrupted job ({manifest.get('source_file')})")
+    payload = {
+        "output_path": OUTPUT_FOLDER / manifest["output_file"],
+        "checkpoint_dir": job_dir,
+        "columns": manifest.get("columns"),
+    }
+    if manifest.get("inputs"):
+        payload["inputs"] = [(job_dir / entry["name"], entry["source"]) for entry in manifest["inputs"]]
+    else:
+        payload["input_path"] = job_dir / manifest["input_name"]
+    return job_registry.submit(
+        job_id,
+        payload,
+        priority=manifest.get("priority", 0),
+        output_file=manifest["output_file"],
+        source_file=manifest.get("source_file"),
+        resumed=True,
+    )
+
+
+def list_resumable_jobs() -> list[dict]:
+    from checkpoint import list_checkpoints
+
+    active = {
+        job["job_id"] for job in job_registry.list_jobs() if job["status"] in ("queued", "processing")
+    }
+    return [manifest for manifest in list_checkpoints(CHECKPOINT_FOLDER) if manifest.get("job_id") not in active]
+
+
+def resume_interrupted_jobs() -> None:
+    """서버 시작 시 오래된 체크포인트 정리 후 (설정 시) 중단된 작업 자동 재개"""
+    from checkpoint import prune_checkpoints
+
+    removed = prune_checkpoints(CHECKPOINT_FOLDER, CHECKPOINT_MAX_AGE_DAYS)
+    if removed:
+        logger.info(f"Removed {removed} expired checkpoint(s)")
+
+    resumable = list_resumable_jobs()
+    if resumable:
+        logger.info(f"{len(resumable)} interrupted job(s) can be resumed")
+    if CHECKPOINT_AUTO_RESUME:
+        for manifest in resumable:
+            resume_job(manifest["job_id"])
+
+
+job_registry = JobRegistry(run_translation_job, _new_status, worker_count=TRANSLATION_JOB_WORKERS)
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"})
+    """서버 준비 여부 (항상 200). llm_ready는 LLM 워밍업이 끝났거나 실제 호출이 성공했을 때 true"""
+    warmup = get_llm_warmup()
+    return jsonify({
+        "status": "ok",
+        "llm_ready": warmup["state"] == "ready",
+        "llm_warmup": warmup["state"],
+        "llm_warmup_error": warmup["error"],
+    })
+
+
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return Response(metrics_registry.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/llm/health", methods=["GET"])
+def llm_health():
+    """번역 백엔드 상태 (Ollama는 서버 연결과 모델 설치 여부까지 확인)"""
+    backend = get_llm_backend()
+    if not backend:
+        return jsonify({"backend": TRANSLATION_MODE, "ready": False, "error": llm_backend_error}), 503
+    info = backend.health()
+    return jsonify(info), (200 if info.get("ready") else 503)
 
 
 @app.route("/heartbeat", methods=["POST"])
@@ -507,11 +1719,10 @@ def serve_icon():
 
 @app.route("/upload", methods=["POST"])
 def upload_file():
-    if is_processing():
-        return jsonify({"error": "번역이 진행 중입니다. 완료 후 다시 시도해 주세요."}), 409
-
-    if not get_gemini_model():
-        return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 400
+    if not get_llm_backend():
+        if TRANSLATION_MODE == "gemini" and not os.environ.get("GEMINI_API_KEY"):
+            return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 400
+        return jsonify({"error": f"번역 엔진을 초기화할 수 없습니다: {llm_backend_error}"}), 400
 
     file = request.files.get("file")
     if not file:
@@ -523,39 +1734,261 @@ def upload_file():
     if not is_allowed_file(file.filename):
         return jsonify({"error": "엑셀 파일(.xlsx)만 업로드 가능합니다."}), 400
 
+    try:
+        priority = int(request.form.get("priority", 0))
+    except ValueError:
+        return jsonify({"error": "priority는 정수여야 합니다."}), 400
+    # 번역할 열 헤더 이름 (쉼표 구분, 비우면 TRANSLATION_COLUMNS 규칙으로 자동 선택)
+    columns = [name.strip() for name in request.form.get("columns", "").split(",") if name.strip()] or None
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     nonce = uuid4().hex[:8]
     input_filename = secure_filename(f"input_{timestamp}_{nonce}{Path(file.filename).suffix.lower()}")
     output_filename = secure_filename(f"translated_{timestamp}_{nonce}.xlsx")
 
-    input_path = UPLOAD_FOLDER / input_filename
+    # 입력 파일은 작업 폴더(체크포인트)에 보관해 중단 시 재개할 수 있게 함
+    job_id = uuid4().hex
+    job_dir = CHECKPOINT_FOLDER / job_id
+    input_path = job_dir / input_filename
     output_path = OUTPUT_FOLDER / output_filename
 
     try:
+        from checkpoint import write_manifest
+
+        write_manifest(
+            job_dir,
+            job_id=job_id,
+            status="queued",
+            input_name=input_filename,
+            output_file=output_filename,
+            source_file=file.filename,
+            priority=priority,
+            columns=columns,
+        )
         file.save(str(input_path))
     except Exception as exc:
         logger.error(f"Failed to save upload: {exc}")
         return jsonify({"error": "파일 저장에 실패했습니다."}), 500
 
+    job = job_registry.submit(
+        job_id,
+        {"input_path": input_path, "output_path": output_path, "checkpoint_dir": job_dir, "columns": columns},
+        priority=priority,
+        output_file=output_filename,
+        source_file=file.filename,
+    )
+    logger.info(f"[{job_id}] Queued {file.filename} (priority {priority})")
+
+    return jsonify({
+        "message": "번역이 시작되었습니다.",
+        "filename": output_filename,
+        "job_id": job_id,
+        "queue_position": job.get("queue_position", 0),
+    })
+
+
+@app.route("/upload/batch", methods=["POST"])
+def upload_batch():
+    """여러 .xlsx 파일(files 필드) 또는 zip을 한 작업으로 번역하고 결과를 zip 하나로 돌려줌
+
+    모든 파일의 셀이 한 번의 중복 제거/번역 메모리 조회를 거치므로, 회귀 TC처럼 문장이 겹치는
+    파일 묶음은 파일별로 따로 올리는 것보다 훨씬 적은 요청으로 끝난다.
+    """
+    if not get_llm_backend():
+        if TRANSLATION_MODE == "gemini" and not os.environ.get("GEMINI_API_KEY"):
+            return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 400
+        return jsonify({"error": f"번역 엔진을 초기화할 수 없습니다: {llm_backend_error}"}), 400
+
+    uploads = [file for file in request.files.getlist("files") if file and file.filename]
+    if not uploads:
+        return jsonify({"error": "파일이 없습니다."}), 400
+    for file in uploads:
+        if not (is_allowed_file(file.filename) or Path(file.filename).suffix.lower() == ".zip"):
+            return jsonify({"error": "엑셀 파일(.xlsx) 또는 zip 파일만 업로드 가능합니다."}), 400
+
+    try:
+        priority = int(request.form.get("priority", 0))
+    except ValueError:
+        return jsonify({"error": "priority는 정수여야 합니다."}), 400
+    columns = [name.strip() for name in request.form.get("columns", "").split(",") if name.strip()] or None
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    nonce = uuid4().hex[:8]
+    output_filename = secure_filename(f"translated_batch_{timestamp}_{nonce}.zip")
     job_id = uuid4().hex
-    reset_status(job_id=job_id, output_file=output_filename)
-    update_status(status="processing")
+    job_dir = CHECKPOINT_FOLDER / job_id
+    output_path = OUTPUT_FOLDER / output_filename
+
+    from checkpoint import remove_checkpoint, write_manifest
+
+    inputs = []
+    try:
+        job_dir.mkdir(parents=True, exist_ok=True)
+        budget = [BATCH_MAX_EXTRACT_MB * 1024 * 1024]
+        for file in uploads:
+            if Path(file.filename).suffix.lower() == ".zip":
+                inputs.extend(extract_batch_archive(file.stream, job_dir, len(inputs), budget))
+            else:
+                stored_name = f"input_{len(inputs):04d}.xlsx"
+                file.save(str(job_dir / stored_name))
+                inputs.append((stored_name, file.filename))
+            if len(inputs) > BATCH_MAX_FILES:
+                raise ValueError(f"한 번에 최대 {BATCH_MAX_FILES}개 파일까지 번역할 수 있습니다.")
+        if not inputs:
+            raise ValueError("zip 안에 엑셀 파일(.xlsx)이 없습니다.")
+        write_manifest(
+            job_dir,
+            job_id=job_id,
+            status="queued",
+            inputs=[{"name": name, "source": source} for name, source in inputs],
+            output_file=output_filename,
+            source_file=f"{len(inputs)} files",
+            priority=priority,
+            columns=columns,
+        )
+    except ValueError as exc:
+        remove_checkpoint(job_dir)
+        return jsonify({"error": str(exc)}), 400
+    except Exception as exc:
+        remove_checkpoint(job_dir)
+        logger.error(f"Failed to save batch upload: {exc}")
+        return jsonify({"error": "파일 저장에 실패했습니다."}), 500
 
-    thread = Thread(
-        target=process_excel_translation,
-        args=(input_path, output_path, job_id),
-        daemon=True,
+    job = job_registry.submit(
+        job_id,
+        {
+            "inputs": [(job_dir / name, source) for name, source in inputs],
+            "output_path": output_path,
+            "checkpoint_dir": job_dir,
+            "columns": columns,
+        },
+        priority=priority,
+        output_file=output_filename,
+        source_file=f"{len(inputs)} files",
     )
-    thread.start()
+    logger.info(f"[{job_id}] Queued batch of {len(inputs)} workbooks (priority {priority})")
 
-    return jsonify({"message": "번역이 시작되었습니다.", "filename": output_filename, "job_id": job_id})
+    return jsonify({
+        "message": "일괄 번역이 시작되었습니다.",
+        "filename": output_filename,
+        "job_id": job_id,
+        "file_count": len(inputs),
+        "queue_position": job.get("queue_position", 0),
+    })
 
 
 @app.route("/status", methods=["GET"])
 def get_status():
+    """가장 최근 작업의 상태 (이전 클라이언트 호환용)"""
     return jsonify(get_status_snapshot())
 
 
+@app.route("/status/<job_id>", methods=["GET"])
+def get_job_status(job_id):
+    status = get_status_snapshot(job_id)
+    if status is None:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return jsonify(status)
+
+
+@app.route("/status/stream/<job_id>", methods=["GET"])
+def stream_job_status(job_id):
+    """작업 상태를 Server-Sent Events로 푸시 (처음엔 전체 상태, 이후엔 바뀐 필드만)
+
+    상태가 바뀔 때만 이벤트를 보내고, 작업이 끝나면 마지막 이벤트 후 스트림을 닫는다.
+    """
+    if job_registry.get(job_id) is None:
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+
+    def generate():
+        last = {}
+        version = -1
+        while True:
+            new_version = job_registry.wait_for_change(version, timeout=STATUS_STREAM_KEEPALIVE)
+            if new_version == version:
+                yield ": keep-alive\n\n"
+                continue
+            version = new_version
+
+            snapshot = job_registry.get(job_id)
+            if snapshot is None:
+                yield f"event: gone\ndata: {json.dumps({'job_id': job_id})}\n\n"
+                return
+            delta = {key: value for key, value in snapshot.items() if last.get(key) != value}
+            delta.update({key: None for key in last if key not in snapshot})
+            if delta:
+                delta["job_id"] = job_id
+                last = snapshot
+                yield f"id: {version}\ndata: {json.dumps(delta, ensure_ascii=False)}\n\n"
+            if snapshot["status"] in FINISHED_STATES:
+                return
+            time.sleep(STATUS_STREAM_MIN_INTERVAL)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    return jsonify({"jobs": job_registry.list_jobs(), "counts": job_registry.counts()})
+
+
+@app.route("/jobs/resumable", methods=["GET"])
+def get_resumable_jobs():
+    return jsonify({"jobs": list_resumable_jobs()})
+
+
+@app.route("/jobs/<job_id>/resume", methods=["POST"])
+def resume_job_route(job_id):
+    job = resume_job(job_id)
+    if job is None:
+        return jsonify({"error": "재개할 수 있는 작업이 없습니다."}), 404
+    return jsonify({"message": "작업을 재개합니다.", "job_id": job_id, "filename": job.get("output_file")})
+
+
+@app.route("/glossary", methods=["GET"])
+def get_glossary_info():
+    current = get_glossary()
+    path = glossary_path()
+    return jsonify(current.stats() if current else {"path": str(path) if path else None, "terms": 0})
+
+
+@app.route("/glossary", methods=["POST"])
+def upload_glossary():
+    """용어집 파일(CSV/TSV/JSON)을 교체하고 매처를 다시 빌드 (다음 번역 요청부터 적용)"""
+    global glossary, glossary_checked
+    if GLOSSARY_FILE:
+        return jsonify({"error": "GLOSSARY_FILE 환경 변수로 지정된 용어집은 업로드로 바꿀 수 없습니다."}), 409
+    file = request.files.get("file")
+    suffix = Path(file.filename).suffix.lower() if file and file.filename else ""
+    if suffix not in GLOSSARY_EXTENSIONS:
+        return jsonify({"error": "용어집은 .csv, .tsv, .json 파일만 업로드 가능합니다."}), 400
+
+    from glossary import Glossary
+
+    target = DATA_DIR / f"glossary{suffix}"
+    tmp_path = DATA_DIR / f"glossary.upload{suffix}"
+    file.save(str(tmp_path))
+    try:
+        loaded = Glossary.load(tmp_path)
+    except Exception as exc:
+        safe_unlink(tmp_path)
+        return jsonify({"error": f"용어집을 읽을 수 없습니다: {exc}"}), 400
+    os.replace(tmp_path, target)
+    for other in GLOSSARY_EXTENSIONS:
+        if other != suffix:
+            safe_unlink(DATA_DIR / f"glossary{other}")
+    loaded.path = target
+    with glossary_lock:
+        glossary = loaded
+        glossary_checked = True
+    logger.info(f"Glossary replaced: {target} ({len(loaded)} terms)")
+    return jsonify(loaded.stats())
+
+
 @app.route("/download/<path:filename>", methods=["GET"])
 def download_file(filename):
     safe_name = secure_filename(filename)
@@ -581,24 +2014,69 @@ def file_too_large(_error):
     return jsonify({"error": f"파일이 너무 큽니다. (최대 {MAX_UPLOAD_MB}MB)"}), 413
 
 
+def parse_log_time(value: str | None) -> float | None:
+    """since/until 파라미터: epoch 초 또는 ISO 8601 시각"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def query_log_buffer(args):
+    """메모리 버퍼에서 level/job_id/시간 범위로 필터링한 구조화 레코드 반환"""
+    level_name = (args.get('level') or "NOTSET").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        return jsonify({"error": f"알 수 없는 로그 레벨: {level_name}"}), 400
+    try:
+        since = parse_log_time(args.get('since'))
+        until = parse_log_time(args.get('until'))
+        after = int(args.get('after', 0))
+        limit = min(max(int(args.get('limit', 200)), 1), 1000)
+    except ValueError as e:
+        return jsonify({"error": f"잘못된 파라미터: {e}"}), 400
+    result = log_buffer.query(
+        level=level, job_id=args.get('job_id') or None, since=since, until=until, after=after, limit=limit
+    )
+    result["showing"] = len(result["records"])
+    return jsonify(result)
+
+
 @app.route("/logs", methods=["GET"])
 def get_logs():
-    """최근 로그를 반환 (웹 UI 콘솔용)"""
+    """최근 로그를 반환 (웹 UI 콘솔용)
+
+    ?lines=N: 파일 끝에서 N줄만 읽음. ?cursor=C: 이전 응답의 cursor 이후 추가된 줄만 반환
+    ?source=memory (또는 level/job_id/since/until/after 지정): 메모리 버퍼의 구조화 레코드 반환
+    """
+    buffer_params = ('level', 'job_id', 'since', 'until', 'after')
+    if request.args.get('source') == "memory" or any(key in request.args for key in buffer_params):
+        return query_log_buffer(request.args)
+
     try:
-        lines = int(request.args.get('lines', 100))
-        lines = min(lines, 1000)  # 최대 1000줄
-        
         if not LOG_FILE.exists():
             return jsonify({"logs": [], "message": "로그 파일이 없습니다."})
-        
-        with open(LOG_FILE, 'r', encoding='utf-8', errors='replace') as f:
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            
+
+        cursor = request.args.get('cursor')
+        if cursor:
+            result = log_reader.read_since(LOG_FILE, cursor, max_bytes=LOG_TAIL_MAX_BYTES)
+            return jsonify({
+                "logs": result["lines"],
+                "showing": len(result["lines"]),
+                "cursor": result["cursor"],
+                "rotated": result["rotated"],
+                "truncated": result["truncated"],
+            })
+
+        lines = int(request.args.get('lines', 100))
+        lines = min(max(lines, 1), 1000)  # 최대 1000줄
+        recent_lines, cursor = log_reader.tail_lines(LOG_FILE, lines)
         return jsonify({
-            "logs": [line.rstrip() for line in recent_lines],
-            "total": len(all_lines),
-            "showing": len(recent_lines)
+            "logs": recent_lines,
+            "showing": len(recent_lines),
+            "cursor": cursor,
         })
     except Exception as e:
         logger.error(f"Failed to read logs: {e}")
@@ -615,6 +2093,8 @@ def get_system_info():
         "resource_dir": str(RESOURCE_DIR),
         "data_dir": str(DATA_DIR),
         "log_file": str(LOG_FILE),
+        "translation_mode": TRANSLATION_MODE,
+        "model": get_model_name(),
         "port": get_server_port()
     })
 
@@ -644,6 +2124,8 @@ def is_port_in_use(port: int) -> bool:
 def kill_process_using_port(port: int) -> bool:
     """특정 포트를 사용 중인 프로세스 종료"""
     try:
+        import psutil  # 포트 충돌 시에만 필요하므로 시작 경로에서 임포트하지 않음
+
         for proc in psutil.process_iter(['pid', 'name', 'connections']):
             try:
                 connections = proc.connections()
@@ -702,9 +2184,34 @@ def ensure_port_available(port: int, auto_kill: bool = True) -> int:
     return port  # 일단 시도는 해봄
 
 
+def prewarm_server() -> None:
+    """첫 업로드에서 치르던 비용(엑셀/번역 모듈 임포트, LLM SDK 로드, 번역 메모리 열기)을 미리 처리"""
+    started = time.perf_counter()
+    try:
+        import openpyxl
+        import excel_io
+        import text_segments
+        import checkpoint
+
+        get_translation_memory()
+        get_glossary()
+        get_llm_backend()
+    except Exception as exc:
+        logger.warning(f"Prewarm failed: {exc}")
+    if LLM_PREWARM and warm_up_llm():
+        logger.info(f"LLM ready ({llm_backend.name}, warm-up {get_llm_warmup()['seconds']:.2f}s)")
+    logger.info(f"Prewarm finished in {time.perf_counter() - started:.2f}s")
+    if LLM_PREWARM and LLM_KEEPALIVE_INTERVAL > 0:
+        llm_keepalive_loop()
+
+
 def open_browser(url: str, delay: float = 1.5):
     """서버 준비 후 브라우저 자동 실행"""
     def _open():
+        import webbrowser
+        from urllib.request import urlopen
+        from urllib.error import URLError
+
         time.sleep(delay)
         # 서버가 준비될 때까지 최대 10초 대기
         for _ in range(20):
@@ -731,12 +2238,15 @@ if __name__ == '__main__':
     logger.info("=" * 60)
     
     # API 키 체크 (실제 초기화는 지연)
-    api_key = os.environ.get('GEMINI_API_KEY')
-    if api_key:
-        logger.info("[OK] GEMINI_API_KEY configured")
+    if TRANSLATION_MODE == "ollama":
+        logger.info(f"[OK] Local LLM mode: {OLLAMA_MODEL} @ {OLLAMA_URL}")
     else:
-        logger.warning("[Warning] GEMINI_API_KEY not set")
-        logger.warning("  Please set API key in the web interface")
+        api_key = os.environ.get('GEMINI_API_KEY')
+        if api_key:
+            logger.info("[OK] GEMINI_API_KEY configured")
+        else:
+            logger.warning("[Warning] GEMINI_API_KEY not set")
+            logger.warning("  Please set API key in the web interface")
     
     # 포트 확인 및 확보
     requested_port = get_server_port()
@@ -744,6 +2254,8 @@ if __name__ == '__main__':
     
     url = f"http://127.0.0.1:{available_port}"
     
+    resume_interrupted_jobs()
+
     logger.info(f"Server will run on port {available_port}")
     logger.info(f"Access URL: {url}")
     logger.info("=" * 60)
@@ -758,8 +2270,11 @@ if __name__ == '__main__':
         open_browser(url)
     
     # 127.0.0.1로 바인딩하여 localhost 문제 방지
+    # (app.run 대신 make_server로 먼저 포트를 연 뒤 prewarm을 시작하고 요청 처리)
     try:
-        app.run(host="127.0.0.1", port=available_port, debug=False, use_reloader=False, threaded=True)
+        from werkzeug.serving import make_server
+
+        server = make_server("127.0.0.1", available_port, app, threaded=True)
     except OSError as e:
         if "Address already in use" in str(e):
             logger.error(f"Port {available_port} is still in use. Please close other applications and try again.")
@@ -769,3 +2284,8 @@ if __name__ == '__main__':
         else:
             logger.error(f"Failed to start server: {e}")
         sys.exit(1)
+
+    logger.info(f"Server listening on {url}")
+    if SERVER_PREWARM:
+        Thread(target=prewarm_server, name="prewarm", daemon=True).start()
+    server.serve_forever()
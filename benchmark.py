@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""오프라인 번역 벤치마크 (네트워크 없이 가짜 LLM 백엔드로 process_excel_translation 실행)
+
+python benchmark.py --rows 2000 --cell-length 150 --duplicate-ratio 0.3 --latency 0.2 --error-rate 0.02
+python benchmark.py --rows 2000 --json-out base.json                     # 기준값 저장
+python benchmark.py --rows 2000 --compare base.json --tolerance 0.2      # 회귀 시 종료 코드 1
+
+처리량(셀/초), 셀 지연 시간 p50/p95, 최대 RSS, 첫 진행까지 걸린 시간을 보고한다.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from llm_backends import LLMBackend, LLMBackendError
+
+_BATCH_PAYLOAD = re.compile(r'JSON array of objects with "id" and "text"\):\n(.*?)\n\nRespond with', re.DOTALL)
+_SINGLE_TEXT = re.compile(r"Korean text to translate:\n(.*?)\n\nProvide ONLY", re.DOTALL)
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+
+
+def fake_translate(text: str) -> str:
+    return _HANGUL_RUN.sub("word", text)
+
+
+class FakeLLMBackend(LLMBackend):
+    """결정적인 가짜 모델: 지연 시간/오류를 프롬프트 해시와 시도 횟수로 재현 가능하게 생성
+
+    latency + latency_per_item * 항목 수 + [0, jitter) 만큼 대기한 뒤 한글을 치환한 번역을 돌려준다.
+    error_rate는 재시도 가능한 503, quota_rate는 429, drop_rate는 배치 응답에서 항목 누락 비율이다.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.1, latency_per_item: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, quota_rate: float = 0.0, drop_rate: float = 0.0, seed: int = 0):
+        super().__init__("fake-model")
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quota_rate = quota_rate
+        self.drop_rate = drop_rate
+        self.seed = seed
+        self.cell_latencies = []
+        self._attempts = {}
+        self._lock = threading.Lock()
+
+    def _rng(self, prompt: str) -> random.Random:
+        digest = zlib.crc32(prompt.encode("utf-8"))
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+        return random.Random((self.seed << 40) ^ (digest << 8) ^ attempt)
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        rng = self._rng(prompt)
+        batch = _BATCH_PAYLOAD.search(prompt)
+        items = json.loads(batch.group(1)) if batch else None
+        count = len(items) if items is not None else 1
+
+        delay = self.latency + self.latency_per_item * count + rng.uniform(0, self.jitter)
+        time.sleep(delay)
+        roll = rng.random()
+        if roll < self.quota_rate:
+            raise LLMBackendError("Fake API error 429: quota exceeded")
+        if roll < self.quota_rate + self.error_rate:
+            raise LLMBackendError("Fake API error 503: service unavailable")
+
+        with self._lock:
+            self.cell_latencies.extend([delay] * count)
+        if items is None:
+            match = _SINGLE_TEXT.search(prompt)
+            return fake_translate(match.group(1) if match else prompt)
+        results = [
+            {"id": item["id"], "translation": fake_translate(item["text"])}
+            for item in items
+            if rng.random() >= self.drop_rate
+        ]
+        return json.dumps(results, ensure_ascii=False)
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+class RSSSampler(threading.Thread):
+    """주기적으로 현재 프로세스의 RSS를 읽어 최댓값을 기록"""
+
+    def __init__(self, interval: float = 0.05):
+        super().__init__(daemon=True)
+        import psutil
+
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak = self.process.memory_info().rss
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+        return self.peak
+
+
+def run_benchmark(app, input_file: Path, work_dir: Path, backend: FakeLLMBackend) -> dict:
+    """job_registry를 통해 작업 하나를 실행하고 상태 변화를 관찰해 지표 계산"""
+    job_id = f"bench{int(time.time() * 1000)}"
+    input_copy = work_dir / f"{job_id}.xlsx"
+    shutil.copyfile(input_file, input_copy)
+    output_file = work_dir / f"{job_id}_translated.xlsx"
+    app.llm_backend = backend
+
+    sampler = RSSSampler()
+    sampler.start()
+    started = time.perf_counter()
+    first_progress = None
+    version = app.job_registry.version
+    app.job_registry.submit(job_id, {"input_path": input_copy, "output_path": output_file})
+    while True:
+        version = app.job_registry.wait_for_change(version, timeout=0.5)
+        status = app.job_registry.get(job_id)
+        if first_progress is None and status.get("current", 0) > 0:
+            first_progress = time.perf_counter() - started
+        if status["status"] in app.FINISHED_STATES:
+            break
+    elapsed = time.perf_counter() - started
+    peak_rss = sampler.stop()
+
+    job_metrics = status.get("metrics") or {}
+    return {
+        "status": status["status"],
+        "error": status.get("error"),
+        "cells": status.get("total", 0),
+        "unique_cells": status.get("unique_total", 0),
+        "elapsed_seconds": round(elapsed, 3),
+        "cells_per_second": round(status.get("total", 0) / elapsed, 2) if elapsed else 0.0,
+        "cell_latency_p50": round(percentile(backend.cell_latencies, 0.5), 4),
+        "cell_latency_p95": round(percentile(backend.cell_latencies, 0.95), 4),
+        "time_to_first_progress": round(first_progress, 3) if first_progress is not None else None,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1),
+        "llm_calls": job_metrics.get("llm_calls", 0),
+        "retries": job_metrics.get("retries", 0),
+        "workbook_load_seconds": job_metrics.get("workbook_load_seconds"),
+        "workbook_save_seconds": job_metrics.get("workbook_save_seconds"),
+    }
+
+
+# 회귀 비교 대상: (키, 값이 클수록 좋은지)
+COMPARED_KEYS = (
+    ("cells_per_second", True),
+    ("cell_latency_p95", False),
+    ("time_to_first_progress", False),
+    ("peak_rss_mb", False),
+)
+
+
+def compare_results(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """기준값 대비 tolerance(비율) 이상 나빠진 항목 목록"""
+    regressions = []
+    for key, higher_is_better in COMPARED_KEYS:
+        current, base = result.get(key), baseline.get(key)
+        if not current or not base:
+            continue
+        change = (current - base) / base
+        if (-change if higher_is_better else change) > tolerance:
+            regressions.append(f"{key}: {base} -> {current} ({change:+.0%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="가짜 LLM 백엔드로 번역 파이프라인 벤치마크 (오프라인)")
+    parser.add_argument("--input", help="사용할 엑셀 파일 (없으면 합성 워크북 생성)")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--cell-length", type=int, default=120)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.1, help="요청당 기본 지연 시간(초)")
+    parser.add_argument("--latency-per-item", type=float, default=0.005, help="배치 항목당 추가 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="재시도 가능한 오류(503) 비율")
+    parser.add_argument("--quota-rate", type=float, default=0.0, help="할당량 오류(429) 비율")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="배치 응답에서 누락되는 항목 비율")
+    parser.add_argument("--cache", action="store_true", help="번역 메모리 사용 (기본은 끔)")
+    parser.add_argument("--json-out", help="결과를 JSON으로 저장")
+    parser.add_argument("--compare", help="기준 결과 JSON과 비교")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 악화 비율 (기본 20%%)")
+    args = parser.parse_args(argv)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="translator-bench-"))
+    try:
+        # app은 임포트 시 환경 변수를 읽으므로 임시 데이터 폴더/설정을 먼저 지정
+        os.environ.setdefault("TRANSLATOR_DATA_DIR", str(work_dir / "data"))
+        os.environ.setdefault("TRANSLATOR_LOG_DIR", str(work_dir / "log"))
+        os.environ.setdefault("TRANSLATION_CACHE_ENABLED", "1" if args.cache else "0")
+        os.environ.setdefault("GEMINI_RETRY_BACKOFF", "0.05")
+        import app
+
+        if args.input:
+            input_file = Path(args.input)
+        else:
+            from create_sample import create_synthetic_workbook
+
+            input_file = work_dir / "synthetic.xlsx"
+            generate_started = time.perf_counter()
+            create_synthetic_workbook(input_file, args.rows, args.cell_length, args.duplicate_ratio, args.seed)
+            print(f"Generated {args.rows} rows in {time.perf_counter() - generate_started:.1f}s: {input_file}")
+
+        backend = FakeLLMBackend(
+            latency=args.latency,
+            latency_per_item=args.latency_per_item,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            quota_rate=args.quota_rate,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+        )
+        result = run_benchmark(app, input_file, work_dir, backend)
+        result["config"] = {
+            key: value for key, value in vars(args).items() if key not in ("json_out", "compare", "tolerance")
+        }
+        result["config"].update(
+            concurrency=app.TRANSLATION_CONCURRENCY,
+            batch_max_items=app.TRANSLATION_BATCH_MAX_ITEMS,
+            segment_mode=app.TRANSLATION_SEGMENT_MODE,
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(json.dumps({key: value for key, value in result.items() if key != "config"}, indent=2))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if result["status"] != "completed":
+        print(f"Benchmark job failed: {result['error']}", file=sys.stderr)
+        return 1
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_results(result, baseline, args.tolerance)
+        if regressions:
+            print("Performance regression:\n  " + "\n  ".join(regressions), file=sys.stderr)
+            return 1
+        print(f"No regression against {args.compare} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
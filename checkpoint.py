@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""번역 작업 체크포인트: 작업 폴더(manifest + 입력 파일 + 번역 저널) 관리
+
+저널(journal.jsonl)에는 완료된 고유 셀 번역이 한 줄씩 추가된다. 매 기록마다 flush하므로
+프로세스가 죽어도(SIGTERM 포함) OS 버퍼에 남은 내용은 보존되고, fsync는 주기적으로만 한다.
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+JOURNAL_NAME = "journal.jsonl"
+
+
+def write_manifest(job_dir: Path, **fields) -> dict:
+    """manifest.json 생성/갱신 (기존 값에 병합)"""
+    job_dir = Path(job_dir)
+    job_dir.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(job_dir) or {"created_at": datetime.utcnow().isoformat()}
+    manifest.update(fields)
+    manifest["updated_at"] = datetime.utcnow().isoformat()
+    tmp_path = job_dir / (MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, job_dir / MANIFEST_NAME)
+    return manifest
+
+
+def read_manifest(job_dir: Path) -> dict | None:
+    try:
+        return json.loads((Path(job_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def load_journal(job_dir: Path) -> dict:
+    """저널을 읽어 (text, context) -> 번역 반환 (마지막 줄이 잘려 있으면 무시)"""
+    results = {}
+    path = Path(job_dir) / JOURNAL_NAME
+    if not path.exists():
+        return results
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                results[(entry["t"], entry["c"])] = entry["r"]
+            except (ValueError, KeyError, TypeError):
+                continue
+    return results
+
+
+class CheckpointJournal:
+    """완료된 번역을 저널에 추가 기록 (스레드 안전)"""
+
+    def __init__(self, job_dir: Path, fsync_interval: float = 5.0):
+        self.path = Path(job_dir) / JOURNAL_NAME
+        self.fsync_interval = fsync_interval
+        self._last_sync = time.monotonic()
+        self._lock = Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, text: str, context: str, translation: str) -> None:
+        line = json.dumps({"t": text, "c": context, "r": translation}, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+            if time.monotonic() - self._last_sync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+                self._file = None
+
+
+def manifest_inputs(manifest: dict) -> list[dict]:
+    """작업 폴더에 저장된 입력 파일 목록 [{"name": 저장 이름, "source": 원래 이름}]
+
+    일괄 작업은 inputs 목록을, 단일 파일 작업은 input_name/source_file을 기록한다.
+    """
+    if manifest.get("inputs"):
+        return manifest["inputs"]
+    if manifest.get("input_name"):
+        return [{"name": manifest["input_name"], "source": manifest.get("source_file")}]
+    return []
+
+
+def has_inputs(job_dir: Path, manifest: dict) -> bool:
+    inputs = manifest_inputs(manifest)
+    return bool(inputs) and all((Path(job_dir) / entry["name"]).is_file() for entry in inputs)
+
+
+def list_checkpoints(root: Path) -> list[dict]:
+    """root 아래 작업 폴더의 manifest 목록 (입력 파일이 남아 있는 것만)"""
+    checkpoints = []
+    if not Path(root).exists():
+        return checkpoints
+    for job_dir in sorted(Path(root).iterdir()):
+        manifest = read_manifest(job_dir) if job_dir.is_dir() else None
+        if not manifest or not has_inputs(job_dir, manifest):
+            continue
+        journal = job_dir / JOURNAL_NAME
+        manifest["job_dir"] = str(job_dir)
+        manifest["journal_bytes"] = journal.stat().st_size if journal.exists() else 0
+        checkpoints.append(manifest)
+    return checkpoints
+
+
+def remove_checkpoint(job_dir: Path) -> None:
+    try:
+        shutil.rmtree(job_dir)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning(f"Failed to remove checkpoint: {job_dir} ({exc})")
+
+
+def prune_checkpoints(root: Path, max_age_days: float) -> int:
+    """오래된 작업 폴더 정리"""
+    if max_age_days <= 0 or not Path(root).exists():
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for job_dir in Path(root).iterdir():
+        if job_dir.is_dir() and job_dir.stat().st_mtime < cutoff:
+            remove_checkpoint(job_dir)
+            removed += 1
+    return removed
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""서버 없이 명령줄에서 번역 (CI 파이프라인용)
+
+python -m cli translate in.xlsx -o out.xlsx --concurrency 8
+python -m cli translate suites/ "regression/*.xlsx" --output-dir translated/
+python -m cli text "앱을 실행한다" --context "Test Steps"
+
+여러 파일을 주면 한 작업으로 묶어 모든 파일의 문장을 한 번에 중복 제거/번역한다.
+종료 코드: 0 성공, 1 번역 실패, 2 잘못된 인자/입력 없음, 3 완료했지만 일부 셀/파일 실패
+"""
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_PARTIAL = 3
+
+OUTPUT_SUFFIX = "_translated"
+
+
+def expand_inputs(patterns: list[str]) -> list[Path]:
+    """파일/폴더/글롭 패턴을 .xlsx 파일 목록으로 (폴더는 바로 아래 .xlsx, 엑셀 임시 파일과 이전 결과는 제외)"""
+    files = []
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = sorted(path.glob("*.xlsx"))
+        elif path.is_file():
+            candidates = [path]
+        else:
+            # 윈도우 셸은 와일드카드를 펼치지 않으므로 직접 처리
+            candidates = sorted(Path(match) for match in glob.glob(pattern, recursive=True))
+        for candidate in candidates:
+            if candidate.suffix.lower() != ".xlsx" or candidate.name.startswith("~$"):
+                continue
+            if path.is_dir() and candidate.stem.endswith(OUTPUT_SUFFIX):
+                continue
+            resolved = candidate.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                files.append(candidate)
+    return files
+
+
+def output_path_for(input_file: Path, output_dir: Path | None) -> Path:
+    return (output_dir or input_file.parent) / f"{input_file.stem}{OUTPUT_SUFFIX}.xlsx"
+
+
+def configure_environment(args) -> None:
+    """app은 임포트 시 환경 변수를 읽으므로 임포트 전에 옵션을 반영"""
+    if args.concurrency:
+        os.environ["TRANSLATION_CONCURRENCY"] = str(args.concurrency)
+    if args.backend:
+        os.environ["TRANSLATION_MODE"] = args.backend
+    if args.model:
+        os.environ["GEMINI_MODEL" if (args.backend or os.environ.get("TRANSLATION_MODE", "gemini")) == "gemini"
+                   else "OLLAMA_MODEL"] = args.model
+    if args.no_cache:
+        os.environ["TRANSLATION_CACHE_ENABLED"] = "0"
+    # 콘솔 로그는 경고 이상만 (진행률 출력과 섞이지 않도록), 파일 로그는 그대로 기록
+    if not args.verbose:
+        os.environ.setdefault("CONSOLE_LOG_LEVEL", "WARNING")
+
+
+def format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+class ProgressPrinter:
+    """터미널이면 한 줄을 덮어쓰고, 아니면(CI 로그) interval초마다 한 줄씩 출력"""
+
+    def __init__(self, stream=sys.stderr, interval: float = 5.0, enabled: bool = True):
+        self.stream = stream
+        self.interval = interval
+        self.enabled = enabled
+        self.tty = stream.isatty()
+        self._last_print = 0.0
+        self._last_line = ""
+
+    def update(self, status: dict) -> None:
+        if not self.enabled or status.get("status") != "processing" or not status.get("total"):
+            return
+        line = (
+            f"[{status.get('progress', 0):3d}%] {status.get('current', 0)}/{status['total']} cells "
+            f"({status.get('unique_current', 0)}/{status.get('unique_total', 0)} unique)"
+        )
+        if status.get("estimated_time"):
+            line += f", ETA {format_seconds(status['estimated_time'])}"
+        now = time.monotonic()
+        if self.tty:
+            if line != self._last_line:
+                self.stream.write("\r" + line.ljust(len(self._last_line)))
+                self.stream.flush()
+        elif now - self._last_print >= self.interval:
+            self.stream.write(line + "\n")
+            self._last_print = now
+        self._last_line = line
+
+    def finish(self) -> None:
+        if self.enabled and self.tty and self._last_line:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+def print_summary(status: dict, elapsed: float, documents: list[tuple[Path, Path, str]], stream=sys.stderr) -> None:
+    job_metrics = status.get("metrics") or {}
+    total = status.get("total", 0)
+    print(f"Status: {status['status']} in {format_seconds(elapsed)} ({elapsed:.1f}s)", file=stream)
+    if total:
+        print(
+            f"Cells: {total} ({status.get('unique_total', 0)} unique)"
+            f" ({total / elapsed if elapsed else 0:.1f} cells/s)",
+            file=stream,
+        )
+    if job_metrics:
+        print(
+            f"LLM: {job_metrics.get('llm_calls', 0)} calls, {job_metrics.get('retries', 0)} retries, "
+            f"{job_metrics.get('llm_errors', 0)} errors, cache hit rate {job_metrics.get('cache_hit_rate', 0):.0%}",
+            file=stream,
+        )
+    skipped = {group["name"]: group["error"] for group in status.get("files", []) if group.get("error")}
+    for input_file, output_file, name in documents:
+        if name in skipped:
+            print(f"  SKIP {input_file}: {skipped[name]}", file=stream)
+        elif status["status"] == "completed":
+            print(f"  OK   {input_file} -> {output_file}", file=stream)
+    if status.get("error"):
+        print(f"Error: {status['error']}", file=stream)
+
+
+def run_translate(args) -> int:
+    inputs = expand_inputs(args.inputs)
+    if not inputs:
+        print("No .xlsx files matched: " + " ".join(args.inputs), file=sys.stderr)
+        return EXIT_USAGE
+    if args.output and len(inputs) > 1:
+        print("-o/--output can only be used with a single input file (use --output-dir)", file=sys.stderr)
+        return EXIT_USAGE
+
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    documents = []
+    for input_file in inputs:
+        output_file = Path(args.output) if args.output else output_path_for(input_file, output_dir)
+        if output_file.resolve() == input_file.resolve():
+            print(f"Output would overwrite the input: {input_file}", file=sys.stderr)
+            return EXIT_USAGE
+        if output_file.exists() and not args.overwrite:
+            print(f"Output exists (use --overwrite): {output_file}", file=sys.stderr)
+            return EXIT_USAGE
+        documents.append((input_file, output_file, input_file.name))
+
+    configure_environment(args)
+    import app
+
+    if not app.get_llm_backend():
+        print(f"LLM backend unavailable: {app.llm_backend_error}", file=sys.stderr)
+        return EXIT_FAILED
+
+    # 작업 폴더(체크포인트)를 임시로 두면 입력 파일을 건드리지 않고, 저널은 작업이 끝나면 삭제된다
+    work_dir = Path(tempfile.mkdtemp(prefix="translator-cli-"))
+    job_id = f"cli{int(time.time() * 1000)}"
+    printer = ProgressPrinter(enabled=not args.quiet)
+    started = time.perf_counter()
+    try:
+        version = app.job_registry.version
+        app.job_registry.submit(job_id, {
+            "documents": documents,
+            "checkpoint_dir": work_dir,
+            "columns": [name.strip() for name in args.columns.split(",") if name.strip()] if args.columns else None,
+        })
+        while True:
+            version = app.job_registry.wait_for_change(version, timeout=1.0)
+            status = app.job_registry.get(job_id)
+            if status["status"] in app.FINISHED_STATES:
+                break
+            printer.update(status)
+    except KeyboardInterrupt:
+        printer.finish()
+        print("Interrupted", file=sys.stderr)
+        return EXIT_FAILED
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    printer.finish()
+
+    elapsed = time.perf_counter() - started
+    if not args.quiet:
+        print_summary(status, elapsed, documents)
+    if status["status"] != "completed":
+        return EXIT_FAILED
+    return EXIT_PARTIAL if status.get("error") else EXIT_OK
+
+
+def run_text(args) -> int:
+    configure_environment(args)
+    import app
+
+    if not app.get_llm_backend():
+        print(f"LLM backend unavailable: {app.llm_backend_error}", file=sys.stderr)
+        return EXIT_FAILED
+    text = args.text if args.text is not None else sys.stdin.read()
+    try:
+        print(app.translate_with_llm(text, args.context))
+    except Exception as exc:
+        print(f"Translation failed: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+def add_common_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--concurrency", type=int, help="동시 번역 요청 수 (TRANSLATION_CONCURRENCY)")
+    parser.add_argument("--backend", choices=("gemini", "ollama"), help="번역 백엔드 (TRANSLATION_MODE)")
+    parser.add_argument("--model", help="모델 이름 (GEMINI_MODEL / OLLAMA_MODEL)")
+    parser.add_argument("--no-cache", action="store_true", help="번역 메모리 사용 안 함")
+    parser.add_argument("-v", "--verbose", action="store_true", help="INFO 로그도 콘솔에 출력")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cli", description="테스트케이스 엑셀 번역 (서버 없이 실행)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translate = subparsers.add_parser("translate", help="엑셀 파일 번역")
+    translate.add_argument("inputs", nargs="+", help="엑셀 파일, 폴더 또는 글롭 패턴 (예: 'suites/**/*.xlsx')")
+    translate.add_argument("-o", "--output", help="출력 파일 (입력이 하나일 때만)")
+    translate.add_argument("--output-dir", help="출력 폴더 (기본: 입력 파일 옆에 *_translated.xlsx)")
+    translate.add_argument("--columns", help="번역할 열 헤더 이름 (쉼표 구분, 기본: TRANSLATION_COLUMNS 규칙)")
+    translate.add_argument("--overwrite", action="store_true", help="기존 출력 파일 덮어쓰기")
+    translate.add_argument("-q", "--quiet", action="store_true", help="진행률/요약 출력 안 함")
+    add_common_options(translate)
+    translate.set_defaults(handler=run_translate)
+
+    text = subparsers.add_parser("text", help="문장 하나 번역 (인자가 없으면 표준 입력)")
+    text.add_argument("text", nargs="?")
+    text.add_argument("--context", default="", help="번역 맥락 (예: Test Steps, Expected Result)")
+    add_common_options(text)
+    text.set_defaults(handler=run_text)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,78 +1,143 @@
-import pandas as pd
+"""샘플/합성 테스트케이스 엑셀 파일 생성
+
+python create_sample.py                       # 기본 5행 샘플
+python create_sample.py --rows 5000 --cell-length 200 --duplicate-ratio 0.3 -o big.xlsx
+"""
+import argparse
+import random
+
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-
-# 샘플 데이터 생성
-data = {
-    'TC ID': ['TC-001', 'TC-002', 'TC-003', 'TC-004', 'TC-005'],
-    'Depth 1': ['로그인', '로그인', '회원가입', '프로필', '설정'],
-    'Depth 2': ['정상', '비정상', '신규', '수정', '알림'],
-    'Steps': [
-        '1. 앱을 실행한다\n2. 이메일 입력란에 올바른 이메일을 입력한다\n3. 비밀번호 입력란에 올바른 비밀번호를 입력한다\n4. 로그인 버튼을 클릭한다',
-        '1. 앱을 실행한다\n2. 이메일 입력란에 잘못된 형식의 이메일을 입력한다\n3. 비밀번호 입력란에 비밀번호를 입력한다\n4. 로그인 버튼을 클릭한다',
-        '1. 회원가입 화면으로 이동한다\n2. 필수 항목(이메일, 비밀번호, 이름)을 모두 입력한다\n3. 이용약관에 동의한다\n4. 가입하기 버튼을 클릭한다',
-        '1. 프로필 화면으로 이동한다\n2. 프로필 사진 변경 버튼을 클릭한다\n3. 갤러리에서 사진을 선택한다\n4. 저장 버튼을 클릭한다',
-        '1. 설정 화면으로 이동한다\n2. 알림 설정 메뉴를 클릭한다\n3. 푸시 알림 토글을 ON으로 변경한다\n4. 저장 버튼을 클릭한다'
-    ],
-    'Expected Result': [
-        '로그인이 성공하고 메인 화면으로 이동한다',
-        '이메일 형식이 올바르지 않다는 오류 메시지가 표시된다',
-        '회원가입이 완료되고 환영 메시지가 표시된다',
-        '프로필 사진이 성공적으로 변경되고 저장 완료 메시지가 표시된다',
-        '푸시 알림 설정이 저장되고 확인 메시지가 표시된다'
-    ]
-}
-
-# DataFrame 생성
-df = pd.DataFrame(data)
-
-# Workbook 생성
-wb = Workbook()
-ws = wb.active
-ws.title = "Test Cases"
-
-# DataFrame을 worksheet에 추가
-for r in dataframe_to_rows(df, index=False, header=True):
-    ws.append(r)
-
-# 스타일 설정
-header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-header_font = Font(bold=True, color="FFFFFF", size=11)
-border = Border(
-    left=Side(style='thin', color='000000'),
-    right=Side(style='thin', color='000000'),
-    top=Side(style='thin', color='000000'),
-    bottom=Side(style='thin', color='000000')
-)
-
-# 헤더 스타일 적용
-for cell in ws[1]:
-    cell.fill = header_fill
-    cell.font = header_font
-    cell.alignment = Alignment(horizontal='center', vertical='center')
-    cell.border = border
-
-# 데이터 셀 스타일 적용
-for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-    for cell in row:
+
+HEADERS = ['TC ID', 'Depth 1', 'Depth 2', 'Steps', 'Expected Result']
+
+# 샘플 데이터
+SAMPLE_ROWS = [
+    ('TC-001', '로그인', '정상',
+     '1. 앱을 실행한다\n2. 이메일 입력란에 올바른 이메일을 입력한다\n3. 비밀번호 입력란에 올바른 비밀번호를 입력한다\n4. 로그인 버튼을 클릭한다',
+     '로그인이 성공하고 메인 화면으로 이동한다'),
+    ('TC-002', '로그인', '비정상',
+     '1. 앱을 실행한다\n2. 이메일 입력란에 잘못된 형식의 이메일을 입력한다\n3. 비밀번호 입력란에 비밀번호를 입력한다\n4. 로그인 버튼을 클릭한다',
+     '이메일 형식이 올바르지 않다는 오류 메시지가 표시된다'),
+    ('TC-003', '회원가입', '신규',
+     '1. 회원가입 화면으로 이동한다\n2. 필수 항목(이메일, 비밀번호, 이름)을 모두 입력한다\n3. 이용약관에 동의한다\n4. 가입하기 버튼을 클릭한다',
+     '회원가입이 완료되고 환영 메시지가 표시된다'),
+    ('TC-004', '프로필', '수정',
+     '1. 프로필 화면으로 이동한다\n2. 프로필 사진 변경 버튼을 클릭한다\n3. 갤러리에서 사진을 선택한다\n4. 저장 버튼을 클릭한다',
+     '프로필 사진이 성공적으로 변경되고 저장 완료 메시지가 표시된다'),
+    ('TC-005', '설정', '알림',
+     '1. 설정 화면으로 이동한다\n2. 알림 설정 메뉴를 클릭한다\n3. 푸시 알림 토글을 ON으로 변경한다\n4. 저장 버튼을 클릭한다',
+     '푸시 알림 설정이 저장되고 확인 메시지가 표시된다'),
+]
+
+# 합성 데이터용 어휘
+_SCREENS = ['로그인', '회원가입', '프로필', '설정', '알림', '검색', '결제', '장바구니', '주문 내역', '고객센터']
+_ELEMENTS = ['버튼', '입력란', '토글', '체크박스', '드롭다운 메뉴', '탭', '팝업', '목록 항목', '아이콘', '배너']
+_ACTIONS = ['클릭한다', '길게 누른다', '입력한다', '선택한다', '스크롤한다', '확인한다', '변경한다', '삭제한다']
+_RESULTS = [
+    '화면이 정상적으로 표시된다', '오류 메시지가 표시된다', '변경 사항이 저장된다',
+    '이전 화면으로 이동한다', '확인 팝업이 표시된다', '목록이 새로고침된다',
+]
+
+
+def style_sheet(ws, styled_rows: int | None = None) -> None:
+    """헤더/데이터 셀 서식과 열 너비 지정 (styled_rows 이후 행은 서식 생략)"""
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    border = Border(
+        left=Side(style='thin', color='000000'),
+        right=Side(style='thin', color='000000'),
+        top=Side(style='thin', color='000000'),
+        bottom=Side(style='thin', color='000000')
+    )
+
+    # 헤더 스타일 적용
+    for cell in ws[1]:
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = Alignment(horizontal='center', vertical='center')
         cell.border = border
-        cell.alignment = Alignment(vertical='top', wrap_text=True)
-
-# 열 너비 조정
-ws.column_dimensions['A'].width = 12  # TC ID
-ws.column_dimensions['B'].width = 15  # Depth 1
-ws.column_dimensions['C'].width = 15  # Depth 2
-ws.column_dimensions['D'].width = 50  # Steps
-ws.column_dimensions['E'].width = 50  # Expected Result
-
-# 행 높이 자동 조정
-for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-    ws.row_dimensions[row[0].row].height = 80
-
-# 파일 저장
-import datetime
-timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-output_file = f'한국어 테스트케이스_{timestamp}.xlsx'
-wb.save(output_file)
-print(f"✓ 샘플 파일이 생성되었습니다: {output_file}")
+
+    # 데이터 셀 스타일 적용 + 행 높이 조정
+    max_row = ws.max_row if styled_rows is None else min(ws.max_row, styled_rows + 1)
+    for row in ws.iter_rows(min_row=2, max_row=max_row):
+        for cell in row:
+            cell.border = border
+            cell.alignment = Alignment(vertical='top', wrap_text=True)
+        ws.row_dimensions[row[0].row].height = 80
+
+    # 열 너비 조정
+    ws.column_dimensions['A'].width = 12  # TC ID
+    ws.column_dimensions['B'].width = 15  # Depth 1
+    ws.column_dimensions['C'].width = 15  # Depth 2
+    ws.column_dimensions['D'].width = 50  # Steps
+    ws.column_dimensions['E'].width = 50  # Expected Result
+
+
+def build_sample_workbook(rows=SAMPLE_ROWS, styled_rows: int | None = None) -> Workbook:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Test Cases"
+    ws.append(HEADERS)
+    for row in rows:
+        ws.append(list(row))
+    style_sheet(ws, styled_rows)
+    return wb
+
+
+def _synthetic_steps(rng: random.Random, cell_length: int) -> str:
+    lines = []
+    length = 0
+    while not lines or length < cell_length:
+        screen, element = rng.choice(_SCREENS), rng.choice(_ELEMENTS)
+        line = f"{len(lines) + 1}. {screen} 화면에서 {element}을 {rng.choice(_ACTIONS)}"
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def synthetic_rows(rows: int, cell_length: int = 120, duplicate_ratio: float = 0.2, seed: int = 0):
+    """합성 TC 행 생성 (같은 seed면 같은 결과)
+
+    duplicate_ratio 비율의 행은 앞에서 만든 행의 Steps/Expected Result를 그대로 재사용한다.
+    """
+    rng = random.Random(seed)
+    generated = []
+    for idx in range(1, rows + 1):
+        if generated and rng.random() < duplicate_ratio:
+            steps, expected = rng.choice(generated)
+        else:
+            steps = _synthetic_steps(rng, cell_length)
+            expected = f"{rng.choice(_SCREENS)} {rng.choice(_RESULTS)} (#{idx})"
+            generated.append((steps, expected))
+        yield (f"TC-{idx:05d}", rng.choice(_SCREENS), rng.choice(['정상', '비정상', '경계값']), steps, expected)
+
+
+def create_synthetic_workbook(path, rows: int, cell_length: int = 120, duplicate_ratio: float = 0.2,
+                              seed: int = 0) -> None:
+    # 큰 파일은 서식 적용 비용이 커서 처음 100행만 서식 지정
+    wb = build_sample_workbook(synthetic_rows(rows, cell_length, duplicate_ratio, seed), styled_rows=100)
+    wb.save(path)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="샘플/합성 테스트케이스 엑셀 파일 생성")
+    parser.add_argument("--rows", type=int, default=0, help="합성 행 수 (0이면 기본 5행 샘플)")
+    parser.add_argument("--cell-length", type=int, default=120, help="Steps 셀의 대략적인 글자 수")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2, help="중복 행 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="출력 파일 경로")
+    args = parser.parse_args(argv)
+
+    import datetime
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = args.output or f'한국어 테스트케이스_{timestamp}.xlsx'
+    if args.rows > 0:
+        create_synthetic_workbook(output_file, args.rows, args.cell_length, args.duplicate_ratio, args.seed)
+    else:
+        build_sample_workbook().save(output_file)
+    print(f"✓ 샘플 파일이 생성되었습니다: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
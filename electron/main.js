@@ -249,7 +249,8 @@ function createWindow() {
 }
 
 // Flask 서버가 준비될 때까지 대기하는 함수
-function waitForFlaskServer(port, maxRetries = 30, interval = 1000) {
+// 서버가 포트를 연 직후부터 응답하므로 짧은 간격으로 확인 (총 대기 시간은 약 30초로 동일)
+function waitForFlaskServer(port, maxRetries = 150, interval = 200) {
   return new Promise((resolve, reject) => {
     let retries = 0;
     let consecutiveSuccesses = 0;
@@ -285,7 +286,7 @@ function waitForFlaskServer(port, maxRetries = 30, interval = 1000) {
             } else {
               // 재시도 전 체크
               if (retries < maxRetries) {
-                setTimeout(checkServer, 500);
+                setTimeout(checkServer, 100);
               } else {
                 reject(new Error('Max retries reached'));
               }
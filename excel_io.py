@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""번역 결과를 엑셀 파일로 저장하는 writer 모음
+
+translations 형식: {시트 이름: {(row, column): 번역문}} (row/column은 1부터)
+"""
+import logging
+import re
+import shutil
+import zipfile
+from copy import copy
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+# 번역 대상 열: context 이름 -> 헤더 정규식 (대소문자 무시, 부분 일치). context는 프롬프트와 줄 분할 판단에 쓰인다
+KNOWN_COLUMNS = {
+    "Test Steps": r"steps?",
+    "Expected Result": r"expected.*result",
+    "Precondition": r"pre-?conditions?|사전\s*조건",
+    "Title": r"^\s*(tc\s*)?(title|name)\s*$|제목",
+}
+DEFAULT_COLUMN_RULES = "Test Steps,Expected Result"
+
+
+def parse_column_rules(spec: str) -> list[tuple[str, re.Pattern]]:
+    """"Test Steps,Precondition,Notes=^note" 형식을 (context, 패턴) 목록으로 변환
+
+    KNOWN_COLUMNS의 이름은 미리 정의된 패턴을 쓰고, "context=정규식"으로 직접 지정할 수도 있다.
+    """
+    rules = []
+    for entry in (spec or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        context, _, pattern = entry.partition("=")
+        context = context.strip()
+        pattern = pattern.strip() or KNOWN_COLUMNS.get(context) or re.escape(context)
+        rules.append((context, re.compile(pattern, re.IGNORECASE)))
+    return rules
+
+
+def explicit_column_rules(headers) -> list[tuple[str, re.Pattern]]:
+    """헤더 이름 목록을 그대로 일치시키는 규칙 (context는 알려진 열이면 그 이름, 아니면 헤더 자체)"""
+    rules = []
+    for header in headers:
+        header = str(header).strip()
+        if not header:
+            continue
+        context = next(
+            (name for name, pattern in KNOWN_COLUMNS.items() if re.search(pattern, header, re.IGNORECASE)),
+            header,
+        )
+        rules.append((context, re.compile(rf"^\s*{re.escape(header)}\s*$", re.IGNORECASE)))
+    return rules
+
+
+def match_columns(header_row, rules) -> dict[int, str]:
+    """헤더 행에서 규칙에 맞는 열 -> context (열 번호는 1부터, 열마다 처음 맞는 규칙 적용)"""
+    columns = {}
+    for idx, header in enumerate(header_row or (), 1):
+        if header is None:
+            continue
+        text = str(header).strip()
+        for context, pattern in rules:
+            if pattern.search(text):
+                columns[idx] = context
+                break
+    return columns
+
+
+def iter_sheet_rows(ws, min_row: int = 1):
+    """read-only 워크시트의 행을 (행 번호, 값 tuple)로 지연 순회"""
+    for row_idx, values in enumerate(ws.iter_rows(min_row=min_row, values_only=True), min_row):
+        yield row_idx, values
+
+
+def write_full_copy(input_file: Path, output_file: Path, translations: dict) -> None:
+    """워크북 전체를 메모리에 올려 값만 바꾼 뒤 저장 (서식/병합/열 너비 모두 보존)"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(input_file)
+    try:
+        for sheet_name, cells in translations.items():
+            ws = wb[sheet_name]
+            for (row_idx, col), value in cells.items():
+                ws.cell(row=row_idx, column=col).value = value
+        wb.save(output_file)
+    finally:
+        wb.close()
+
+
+def write_streaming_copy(input_file: Path, output_file: Path, translations: dict) -> None:
+    """read-only로 한 행씩 읽어 write-only 워크북으로 바로 내보냄 (메모리 사용량 일정)
+
+    셀 값과 기본 서식(글꼴/채우기/테두리/정렬/표시 형식)만 복사하며,
+    열 너비/행 높이/병합 셀 등 시트 단위 설정은 보존되지 않는다.
+    """
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    source = load_workbook(input_file, read_only=True)
+    target = Workbook(write_only=True)
+    try:
+        for src_ws in source.worksheets:
+            dst_ws = target.create_sheet(title=src_ws.title)
+            cells = translations.get(src_ws.title, {})
+            for row_idx, row in enumerate(src_ws.iter_rows(), 1):
+                out_row = []
+                for col_idx, src_cell in enumerate(row, 1):
+                    value = cells.get((row_idx, col_idx), getattr(src_cell, "value", None))
+                    if not getattr(src_cell, "has_style", False):
+                        out_row.append(value)
+                        continue
+                    cell = WriteOnlyCell(dst_ws, value=value)
+                    cell.font = copy(src_cell.font)
+                    cell.fill = copy(src_cell.fill)
+                    cell.border = copy(src_cell.border)
+                    cell.alignment = copy(src_cell.alignment)
+                    cell.number_format = src_cell.number_format
+                    out_row.append(cell)
+                dst_ws.append(out_row)
+        target.save(output_file)
+    finally:
+        source.close()
+
+
+class PatchError(Exception):
+    """zip 패치 방식으로 저장할 수 없는 워크북 (호출자가 다른 writer로 대체)"""
+
+
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_CELL_ATTR = re.compile(rb'\s([\w:]+)="([^"]*)"')
+
+
+def column_letter(col: int) -> str:
+    letters = ""
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _sheet_parts(zin: zipfile.ZipFile) -> dict:
+    """시트 이름 -> 워크시트 XML 파트 경로"""
+    from xml.etree import ElementTree
+
+    workbook = ElementTree.fromstring(zin.read("xl/workbook.xml"))
+    rels = ElementTree.fromstring(zin.read("xl/_rels/workbook.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{_PKG_REL_NS}Relationship")}
+    parts = {}
+    for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+        target = targets.get(sheet.get(f"{_REL_NS}id"), "")
+        parts[sheet.get("name")] = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    return parts
+
+
+def _inline_string_cell(open_tag: bytes, value) -> bytes:
+    """기존 셀의 속성(r, s 등)은 유지하고 값만 인라인 문자열로 바꾼 <c> 요소"""
+    attrs = [(name, raw) for name, raw in _CELL_ATTR.findall(open_tag) if name != b"t"]
+    attr_text = b"".join(b' %s="%s"' % (name, raw) for name, raw in attrs)
+    text = _ILLEGAL_XML_CHARS.sub("", str(value))
+    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").encode("utf-8")
+    return b'<c%s t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>' % (attr_text, escaped)
+
+
+def patch_sheet_xml(data: bytes, cells: dict) -> bytes:
+    """워크시트 XML에서 번역된 셀 요소만 교체
+
+    셀은 문서 순서(행 -> 열)로 찾아가므로 파이썬 작업량은 번역된 셀 수에 비례하고,
+    나머지 구간은 그대로 이어 붙인다. 셀을 찾지 못하면(예: 네임스페이스 접두어 사용) PatchError.
+    """
+    pieces = []
+    position = 0
+    for (row_idx, col), value in sorted(cells.items()):
+        marker = b'<c r="%s%d"' % (column_letter(col).encode("ascii"), row_idx)
+        start = data.find(marker, position)
+        if start == -1:
+            raise PatchError(f"Cell {column_letter(col)}{row_idx} not found in sheet XML")
+        tag_end = data.find(b">", start)
+        if data[tag_end - 1:tag_end] == b"/":
+            end = tag_end + 1
+        else:
+            close = data.find(b"</c>", tag_end)
+            if close == -1:
+                raise PatchError(f"Unterminated cell {column_letter(col)}{row_idx}")
+            end = close + len(b"</c>")
+        pieces.append(data[position:start])
+        pieces.append(_inline_string_cell(data[start:tag_end], value))
+        position = end
+    pieces.append(data[position:])
+    return b"".join(pieces)
+
+
+def _copy_member(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """수정하지 않은 파트를 원래 압축 방식 그대로 복사 (공개 API로 스트리밍, 큰 파트도 메모리에 올리지 않음)"""
+    target = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    target.compress_type = info.compress_type
+    target.external_attr = info.external_attr
+    target.comment = info.comment
+    with zin.open(info) as src, zout.open(target, "w", force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def write_patched_copy(input_file: Path, output_file: Path, translations: dict) -> None:
+    """xlsx zip에서 번역된 셀이 있는 워크시트 XML만 고쳐 쓰고 나머지 파트는 그대로 복사
+
+    번역문은 인라인 문자열(t="inlineStr")로 넣으므로 sharedStrings.xml도 그대로 둔다.
+    서식/병합/열 너비 등은 모두 원본 그대로이며, 저장 시간은 워크북 크기가 아니라
+    수정된 시트와 번역된 셀 수에 비례한다. 처리할 수 없는 구조면 PatchError.
+    """
+    try:
+        with zipfile.ZipFile(input_file) as zin, zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zout:
+            parts = _sheet_parts(zin)
+            patched = {}
+            for sheet_name, cells in translations.items():
+                if not cells:
+                    continue
+                part = parts.get(sheet_name)
+                if part is None:
+                    raise PatchError(f"Sheet not found: {sheet_name}")
+                patched[part] = patch_sheet_xml(zin.read(part), cells)
+
+            for info in zin.infolist():
+                if info.filename in patched:
+                    target = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    target.compress_type = zipfile.ZIP_DEFLATED
+                    target.external_attr = info.external_attr
+                    zout.writestr(target, patched[info.filename])
+                else:
+                    _copy_member(zin, zout, info)
+    except PatchError:
+        Path(output_file).unlink(missing_ok=True)
+        raise
+    except (zipfile.BadZipFile, KeyError, ValueError, SyntaxError) as exc:
+        Path(output_file).unlink(missing_ok=True)
+        raise PatchError(f"{type(exc).__name__}: {exc}") from exc
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""용어집: 고정 번역(예: "홈 화면" -> "Home screen")을 미리 빌드한 Aho-Corasick 매처로 찾아 적용
+
+파일 형식
+- CSV/TSV: source,target[,비고] (첫 줄이 source/target 헤더면 건너뜀)
+- JSON: {"홈 화면": "Home screen", ...} 또는 [{"source": ..., "target": ...}, ...]
+
+매칭은 텍스트 길이에 비례하며(용어 수와 무관), 겹치는 용어는 가장 왼쪽-가장 긴 것을 택한다.
+영문자/숫자로 시작하거나 끝나는 용어는 단어 경계에서만 매칭하고, 한글 용어는 조사가 붙어도 매칭한다.
+"""
+import csv
+import hashlib
+import json
+from collections import deque
+from pathlib import Path
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번의 순회로 찾는 오토마톤 (생성 후 읽기 전용이라 스레드 간 공유 가능)"""
+
+    def __init__(self, patterns: list[str]):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] = self._out[state] + (index,)
+
+        # 실패 링크는 BFS 순서로 계산하고, 출력은 실패 링크 쪽 출력까지 합쳐 둠
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                # 루트 바로 아래 상태는 자기 자신이 아니라 루트로 실패
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str):
+        """(끝 위치(exclusive), 패턴 번호)를 등장 순서대로"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield position + 1, index
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _normalize(text: str) -> str:
+    # 대소문자만 무시 (길이가 바뀌지 않는 변환이어야 원문 위치와 맞음)
+    return "".join(ch.lower() if ch.isascii() else ch for ch in text)
+
+
+class Glossary:
+    def __init__(self, entries: list[tuple[str, str]], path: Path | None = None):
+        terms = {}
+        for source, target in entries:
+            source, target = source.strip(), target.strip()
+            if source and target:
+                terms[_normalize(source)] = (source, target)
+        self.path = path
+        self._terms = list(terms.values())
+        self._keys = list(terms)
+        self._matcher = AhoCorasick(self._keys)
+        digest = hashlib.sha1()
+        for source, target in self._terms:
+            digest.update(f"{source}\t{target}\n".encode("utf-8"))
+        self.fingerprint = digest.hexdigest()[:12]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @classmethod
+    def load(cls, path: Path) -> "Glossary":
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            data = json.loads(path.read_text(encoding="utf-8-sig"))
+            if isinstance(data, dict):
+                entries = list(data.items())
+            else:
+                entries = [(item["source"], item["target"]) for item in data]
+            return cls([(str(source), str(target)) for source, target in entries], path)
+
+        delimiter = "\t" if path.suffix.lower() in (".tsv", ".txt") else ","
+        entries = []
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row_idx, row in enumerate(csv.reader(f, delimiter=delimiter)):
+                if len(row) < 2 or row[0].lstrip().startswith("#"):
+                    continue
+                if row_idx == 0 and row[0].strip().lower() in ("source", "korean", "ko", "원문", "한국어"):
+                    continue
+                entries.append((row[0], row[1]))
+        return cls(entries, path)
+
+    def find_terms(self, text: str) -> list[tuple[str, str]]:
+        """텍스트에 등장하는 용어 (source, target) 목록 (등장 순서, 중복 제거)"""
+        if not self._terms or not text:
+            return []
+        normalized = _normalize(text)
+        candidates = []
+        for end, index in self._matcher.iter_matches(normalized):
+            start = end - len(self._keys[index])
+            key = self._keys[index]
+            if _is_word_char(key[0]) and start > 0 and _is_word_char(normalized[start - 1]):
+                continue
+            if _is_word_char(key[-1]) and end < len(normalized) and _is_word_char(normalized[end]):
+                continue
+            candidates.append((start, end, index))
+
+        # 가장 왼쪽-가장 긴 매칭만 남김 ("홈 화면" 안의 "화면"은 따로 잡지 않음)
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+        found = {}
+        covered_until = 0
+        for start, end, index in candidates:
+            if start < covered_until:
+                continue
+            covered_until = end
+            found.setdefault(index, None)
+        return [self._terms[index] for index in found]
+
+    @staticmethod
+    def missing_terms(terms: list[tuple[str, str]], translation: str) -> list[tuple[str, str]]:
+        """번역문에 지정한 target이 들어 있지 않은 용어 (대소문자 무시)"""
+        lowered = translation.lower()
+        return [(source, target) for source, target in terms if target.lower() not in lowered]
+
+    def cache_tag(self, terms: list[tuple[str, str]]) -> str:
+        """번역 메모리 키에 붙일 태그: 셀에 걸린 용어와 그 번역이 바뀔 때만 달라짐"""
+        if not terms:
+            return ""
+        digest = hashlib.sha1("\n".join(f"{source}\t{target}" for source, target in terms).encode("utf-8"))
+        return "g" + digest.hexdigest()[:10]
+
+    def stats(self) -> dict:
+        return {"path": str(self.path) if self.path else None, "terms": len(self), "fingerprint": self.fingerprint}
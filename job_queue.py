@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""번역 작업 큐: job_id별 상태 레지스트리 + 우선순위/FIFO 워커 풀"""
+import itertools
+import logging
+import queue
+from datetime import datetime
+from threading import Condition, Lock, Thread
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATES = ("completed", "error")
+
+
+class JobRegistry:
+    """job_id -> 상태 dict를 보관하고, 대기 중인 작업을 워커 스레드에 분배
+
+    우선순위 숫자가 클수록 먼저 실행되고, 같은 우선순위는 제출 순서(FIFO)를 따른다.
+    runner(job_id, payload)는 워커 스레드에서 호출되며 상태 갱신은 update()로 한다.
+    상태가 실제로 바뀔 때마다 전체 version이 올라가며, wait_for_change()로 변경을 기다릴 수 있다.
+    """
+
+    def __init__(self, runner, status_factory, worker_count: int = 1, max_finished: int = 100):
+        self._runner = runner
+        self._status_factory = status_factory
+        self._worker_count = max(1, worker_count)
+        self._max_finished = max_finished
+        self._lock = Lock()
+        self._changed = Condition(self._lock)
+        self._version = 0
+        self._jobs = {}
+        self._payloads = {}
+        self._order = []
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._workers = []
+
+    def start(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for idx in range(self._worker_count):
+                worker = Thread(target=self._worker_loop, name=f"job-worker-{idx + 1}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        logger.info(f"Job queue started with {self._worker_count} worker(s)")
+
+    def submit(self, job_id: str, payload, priority: int = 0, **fields) -> dict:
+        status = self._status_factory()
+        status.update(fields)
+        status.update(
+            job_id=job_id,
+            status="queued",
+            priority=priority,
+            queued_at=datetime.utcnow().isoformat(),
+        )
+        with self._lock:
+            # 같은 job_id로 다시 제출하면(재개) 이전 기록을 대체
+            if job_id in self._jobs:
+                self._order.remove(job_id)
+            self._jobs[job_id] = status
+            self._payloads[job_id] = payload
+            self._order.append(job_id)
+            self._queue.put((-priority, next(self._seq), job_id))
+            self._prune_locked()
+            self._touch_locked()
+        self.start()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            status = self._jobs.get(job_id)
+            if status is None:
+                return None
+            snapshot = dict(status)
+            if snapshot["status"] == "queued":
+                snapshot["queue_position"] = self._queue_position_locked(job_id)
+            return snapshot
+
+    def latest(self) -> dict | None:
+        with self._lock:
+            job_id = self._order[-1] if self._order else None
+        return self.get(job_id) if job_id else None
+
+    def list_jobs(self) -> list[dict]:
+        with self._lock:
+            job_ids = list(self._order)
+        return [snapshot for snapshot in (self.get(job_id) for job_id in reversed(job_ids)) if snapshot]
+
+    def update(self, job_id: str, **kwargs) -> None:
+        with self._lock:
+            status = self._jobs.get(job_id)
+            if status is None:
+                return
+            changed = {key: value for key, value in kwargs.items() if status.get(key) != value}
+            if changed:
+                status.update(changed)
+                self._touch_locked()
+
+    def set_error_once(self, job_id: str, message: str) -> None:
+        with self._lock:
+            status = self._jobs.get(job_id)
+            if status is not None and not status.get("error"):
+                status["error"] = message
+                self._touch_locked()
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def wait_for_change(self, since: int, timeout: float) -> int:
+        """version이 since보다 커질 때까지(최대 timeout초) 기다린 뒤 현재 version 반환"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._version > since, timeout=timeout)
+            return self._version
+
+    def _touch_locked(self) -> None:
+        self._version += 1
+        self._changed.notify_all()
+
+    def counts(self) -> dict:
+        with self._lock:
+            counts = {}
+            for status in self._jobs.values():
+                counts[status["status"]] = counts.get(status["status"], 0) + 1
+            return counts
+
+    def _queue_position_locked(self, job_id: str) -> int:
+        waiting = sorted(
+            (-self._jobs[other_id].get("priority", 0), idx, other_id)
+            for idx, other_id in enumerate(self._order)
+            if self._jobs[other_id]["status"] == "queued"
+        )
+        for position, (_, _, other_id) in enumerate(waiting, 1):
+            if other_id == job_id:
+                return position
+        return 0
+
+    def _prune_locked(self) -> None:
+        finished = [job_id for job_id in self._order if self._jobs[job_id]["status"] in FINISHED_STATES]
+        for job_id in finished[: max(0, len(finished) - self._max_finished)]:
+            self._order.remove(job_id)
+            self._jobs.pop(job_id, None)
+            self._payloads.pop(job_id, None)
+
+    def _worker_loop(self) -> None:
+        while True:
+            _, _, job_id = self._queue.get()
+            with self._lock:
+                payload = self._payloads.get(job_id)
+                status = self._jobs.get(job_id)
+                if status is not None:
+                    status["status"] = "processing"
+                    self._touch_locked()
+            if status is None:
+                continue
+            try:
+                self._runner(job_id, payload)
+            except Exception as exc:
+                logger.error(f"[{job_id}] Job runner crashed: {type(exc).__name__}: {exc}")
+                self.update(
+                    job_id,
+                    status="error",
+                    error=f"{type(exc).__name__}: {exc}",
+                    completed_at=datetime.utcnow().isoformat(),
+                )
+            finally:
+                with self._lock:
+                    self._payloads.pop(job_id, None)
+                    self._prune_locked()
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""LLM 백엔드 추상화 (Gemini API / 로컬 Ollama)
+
+백엔드는 프롬프트 -> 텍스트 생성(generate, 스트리밍은 generate_stream)과 상태 확인(health)만 담당한다.
+번역 프롬프트 구성, 캐시, 재시도, 속도 제한은 app.py에서 모든 백엔드에 공통으로 적용된다.
+"""
+import http.client
+import json
+import logging
+import queue
+import threading
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+DEFAULT_OLLAMA_MODEL = "llama3.2:7b-instruct-q4_K_M"
+
+
+class LLMBackendError(RuntimeError):
+    """백엔드 호출 실패 (메시지에 HTTP 상태 코드를 포함해 재시도 판별에 사용)"""
+
+
+class AbandonedCall:
+    """제한 시간에 버려졌지만 아직 끝나지 않은 호출 (끊을 수 없는 SDK 호출의 읽기 스레드가 끝나면 완료)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._finished = False
+        self._callbacks = []
+
+    def add_done_callback(self, callback) -> None:
+        """호출이 끝나면 callback() 실행 (이미 끝났으면 바로 실행)"""
+        with self._lock:
+            if not self._finished:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def finish(self) -> None:
+        with self._lock:
+            self._finished = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning(f"Abandoned call callback failed: {exc}")
+
+
+class LLMStreamTimeout(LLMBackendError):
+    """스트리밍 응답의 첫 토큰/다음 조각이 제한 시간 안에 오지 않음 (메시지의 timeout으로 재시도 대상)
+
+    pending은 요청을 실제로 끊지 못해 아직 진행 중인 호출(AbandonedCall), 끊었으면 None.
+    """
+
+    def __init__(self, phase: str, seconds: float, pending: AbandonedCall | None = None):
+        self.phase = phase
+        self.pending = pending
+        waited = "first token" if phase == "first_token" else "next chunk"
+        super().__init__(f"Stream timeout: no {waited} within {seconds:g}s")
+
+
+_STREAM_END = object()
+
+
+def iter_with_timeouts(chunks, first_token_timeout: float | None = None, stall_timeout: float | None = None):
+    """블로킹 iterator를 읽기 스레드에서 돌려 첫 조각/조각 사이 제한 시간을 적용 (소켓을 직접 못 다루는 SDK용)
+
+    제한 시간을 넘기면 LLMStreamTimeout. 남겨진 읽기 스레드는 다음 조각이 오거나 SDK 자체
+    타임아웃으로 호출이 끝나면 종료하며, 그때 예외의 pending(AbandonedCall)이 완료된다.
+    """
+    if not first_token_timeout and not stall_timeout:
+        yield from chunks
+        return
+
+    pieces = queue.Queue()
+    cancelled = threading.Event()
+    call = AbandonedCall()
+
+    def reader():
+        try:
+            for chunk in chunks:
+                if cancelled.is_set():
+                    break
+                pieces.put((chunk, None))
+            pieces.put((_STREAM_END, None))
+        except BaseException as exc:
+            pieces.put((_STREAM_END, exc))
+        finally:
+            try:
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+            finally:
+                call.finish()
+
+    threading.Thread(target=reader, name="llm-stream-reader", daemon=True).start()
+    phase, timeout = "first_token", first_token_timeout
+    try:
+        while True:
+            try:
+                chunk, error = pieces.get(timeout=timeout or None)
+            except queue.Empty:
+                raise LLMStreamTimeout(phase, timeout, pending=call) from None
+            if chunk is _STREAM_END:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+            phase, timeout = "stall", stall_timeout
+    finally:
+        cancelled.set()
+
+
+class LLMBackend:
+    name = "base"
+    # generate_stream이 실제로 조각 단위로 돌려주는지 (아니면 app은 generate를 그대로 호출)
+    supports_streaming = False
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        raise NotImplementedError
+
+    def generate_stream(self, prompt: str, json_mode: bool = False,
+                        first_token_timeout: float | None = None, stall_timeout: float | None = None):
+        """응답을 도착하는 대로 텍스트 조각으로 yield. 제한 시간(초, None/0이면 없음)을 넘기면 LLMStreamTimeout
+
+        기본 구현은 generate() 결과를 한 번에 돌려준다 (제한 시간 없음).
+        """
+        yield self.generate(prompt, json_mode=json_mode)
+
+    def health(self) -> dict:
+        return {"backend": self.name, "model": self.model_name, "ready": True}
+
+    def warm_up(self) -> None:
+        """연결/모델을 미리 준비하는 가벼운 호출 (생성 토큰을 쓰지 않음). 실패 시 예외"""
+
+    def close(self) -> None:
+        pass
+
+
+class GeminiBackend(LLMBackend):
+    name = "gemini"
+    supports_streaming = True
+
+    def __init__(self, api_key: str, model_name: str, timeout: float = 120.0):
+        super().__init__(model_name)
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+        self.timeout = timeout
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        request_options = {"timeout": self.timeout}
+        if json_mode:
+            response = self.model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"},
+                request_options=request_options,
+            )
+        else:
+            response = self.model.generate_content(prompt, request_options=request_options)
+        return response.text if response and hasattr(response, "text") else ""
+
+    def generate_stream(self, prompt: str, json_mode: bool = False,
+                        first_token_timeout: float | None = None, stall_timeout: float | None = None):
+        options = {"generation_config": {"response_mime_type": "application/json"}} if json_mode else {}
+
+        def chunks():
+            response = self.model.generate_content(
+                prompt, stream=True, request_options={"timeout": self.timeout}, **options
+            )
+            for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # 안전 필터/종료 사유만 담긴 조각에는 텍스트가 없음
+                    continue
+                if text:
+                    yield text
+
+        # SDK 호출은 중간에 끊을 수 없으므로 읽기 스레드에서 제한 시간을 건다
+        yield from iter_with_timeouts(chunks(), first_token_timeout, stall_timeout)
+
+    def warm_up(self) -> None:
+        # count_tokens는 generate_content와 같은 클라이언트를 쓰므로 채널(TLS) 연결이 미리 맺어짐
+        self.model.count_tokens("warm up")
+
+
+class HTTPConnectionPool:
+    """단일 호스트용 keep-alive 연결 풀 (스레드 안전)"""
+
+    def __init__(self, base_url: str, maxsize: int = 8, timeout: float = 120.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def open(self, method: str, path: str, payload: dict | None = None, timeout: float | None = None):
+        """요청을 보내고 응답 헤더까지 받은 (연결, 응답) 반환. 본문을 다 읽은 뒤 release()로 반납
+
+        재사용한 연결이 끊겨 있으면 새 연결로 한 번 더 시도한다.
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        for attempt in range(2):
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._new_connection(), False
+            conn.timeout = timeout or self.timeout
+            if conn.sock is not None:
+                # 이미 열린 소켓에는 conn.timeout이 적용되지 않음
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                timed_out = isinstance(exc, TimeoutError)
+                if reused and attempt == 0 and not timed_out:
+                    continue
+                raise self.request_error(exc) from exc
+        raise LLMBackendError(f"Connection to {self.host}:{self.port} failed")
+
+    def release(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def request_error(self, exc: Exception) -> LLMBackendError:
+        kind = "timeout" if isinstance(exc, TimeoutError) else "connection error"
+        return LLMBackendError(f"Request to {self.host}:{self.port} failed ({kind}): {exc}")
+
+    def request(self, method: str, path: str, payload: dict | None = None, timeout: float | None = None):
+        """(status, 응답 본문 bytes) 반환"""
+        conn, response = self.open(method, path, payload, timeout)
+        try:
+            data = response.read()
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            raise self.request_error(exc) from exc
+        self.release(conn, response)
+        return response.status, data
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class OllamaBackend(LLMBackend):
+    name = "ollama"
+    supports_streaming = True
+
+    def __init__(self, base_url: str = DEFAULT_OLLAMA_URL, model_name: str = DEFAULT_OLLAMA_MODEL,
+                 timeout: float = 120.0, pool_size: int = 8, options: dict | None = None):
+        super().__init__(model_name)
+        self.base_url = base_url
+        self.pool = HTTPConnectionPool(base_url, maxsize=pool_size, timeout=timeout)
+        # 일관성 있는 번역을 위해 temperature를 낮게 설정
+        self.options = options or {"temperature": 0.3, "top_p": 0.9, "top_k": 40}
+
+    def _post(self, path: str, payload: dict) -> dict:
+        status, data = self.pool.request("POST", path, payload)
+        if status != 200:
+            message = data.decode("utf-8", errors="replace")[:300]
+            raise LLMBackendError(f"Ollama API error {status}: {message}")
+        return json.loads(data.decode("utf-8"))
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        # format=json은 최상위 객체만 허용하는 모델이 있어 배치(JSON 배열) 응답에는 쓰지 않음
+        result = self._post(
+            "/api/generate",
+            {"model": self.model_name, "prompt": prompt, "stream": False, "options": self.options},
+        )
+        return result.get("response", "")
+
+    def generate_stream(self, prompt: str, json_mode: bool = False,
+                        first_token_timeout: float | None = None, stall_timeout: float | None = None):
+        # NDJSON 줄마다 응답 조각이 오므로 소켓 읽기 제한 시간이 곧 첫 토큰/정체 제한 시간이 되고,
+        # 제한 시간에 연결을 닫으면 Ollama도 생성을 멈춘다
+        conn, response = self.pool.open(
+            "POST",
+            "/api/generate",
+            {"model": self.model_name, "prompt": prompt, "stream": True, "options": self.options},
+            timeout=first_token_timeout,
+        )
+        if response.status != 200:
+            message = response.read().decode("utf-8", errors="replace")[:300]
+            self.pool.release(conn, response)
+            raise LLMBackendError(f"Ollama API error {response.status}: {message}")
+
+        phase, timeout = "first_token", first_token_timeout or self.pool.timeout
+        done = finished = False
+        try:
+            while not done:
+                try:
+                    line = response.readline()
+                except TimeoutError as exc:
+                    raise LLMStreamTimeout(phase, timeout) from exc
+                except (http.client.HTTPException, OSError) as exc:
+                    raise self.pool.request_error(exc) from exc
+                if not line:
+                    raise LLMBackendError("Ollama stream ended before done")
+                if not line.strip():
+                    continue
+                if phase == "first_token":
+                    phase, timeout = "stall", stall_timeout or self.pool.timeout
+                    if conn.sock is not None:  # will_close 응답이면 소켓은 응답 쪽으로 넘어감
+                        conn.sock.settimeout(timeout)
+                data = json.loads(line.decode("utf-8"))
+                if data.get("error"):
+                    raise LLMBackendError(f"Ollama API error: {data['error']}")
+                done = bool(data.get("done"))
+                if data.get("response"):
+                    yield data["response"]
+            response.read()
+            finished = True
+        finally:
+            # 끝까지 읽은 연결만 풀에 반납 (중간에 끊긴/버려진 스트림은 닫아서 생성 중단)
+            if finished:
+                self.pool.release(conn, response)
+            else:
+                conn.close()
+
+    def warm_up(self) -> None:
+        # 빈 프롬프트 요청은 모델을 메모리에 올리기만 하고 생성은 하지 않음 (keep-alive 연결은 풀에 남음)
+        self._post("/api/generate", {"model": self.model_name, "prompt": ""})
+
+    def list_models(self) -> list[str]:
+        status, data = self.pool.request("GET", "/api/tags", timeout=5)
+        if status != 200:
+            raise LLMBackendError(f"Ollama API error {status}")
+        return [model.get("name", "") for model in json.loads(data.decode("utf-8")).get("models", [])]
+
+    def health(self) -> dict:
+        try:
+            models = self.list_models()
+        except Exception as exc:
+            return {"backend": self.name, "model": self.model_name, "ready": False, "error": str(exc)}
+        ready = self.model_name in models
+        info = {"backend": self.name, "model": self.model_name, "ready": ready, "models": models}
+        if not ready:
+            info["error"] = f"Model not pulled: {self.model_name}"
+        return info
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def create_backend(mode: str, *, gemini_api_key: str | None = None, gemini_model: str = "gemini-2.5-flash",
+                   ollama_url: str = DEFAULT_OLLAMA_URL, ollama_model: str = DEFAULT_OLLAMA_MODEL,
+                   timeout: float = 120.0, pool_size: int = 8) -> LLMBackend:
+    """설정값(TRANSLATION_MODE)에 맞는 백엔드 생성. 설정 오류는 LLMBackendError"""
+    mode = (mode or "gemini").lower()
+    if mode == "ollama":
+        return OllamaBackend(ollama_url, ollama_model, timeout=timeout, pool_size=pool_size)
+    if mode == "gemini":
+        if not gemini_api_key:
+            raise LLMBackendError("GEMINI_API_KEY not set")
+        return GeminiBackend(gemini_api_key, gemini_model, timeout=timeout)
+    raise LLMBackendError(f"Unknown TRANSLATION_MODE: {mode}")
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""로그 조회: 파일 끝에서부터 읽는 tail 리더 + 바이트 오프셋 커서 기반 증분 읽기
+
+커서 형식: "<파일 식별자>:<바이트 오프셋>". RotatingFileHandler가 파일을 굴리면(rename)
+식별자가 바뀌므로, 굴려진 이전 파일(.1, .2, ...)의 남은 부분을 먼저 읽은 뒤 새 파일 처음부터 이어서 읽는다.
+
+메모리 링 버퍼(LogRingBuffer)는 최근 로그 레코드를 구조화된 형태로 보관해 파일을 읽지 않고 조회한다.
+"""
+import contextvars
+import itertools
+import logging
+import os
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+BLOCK_SIZE = 8192
+# 로테이션된 파일을 찾아볼 최대 개수 (RotatingFileHandler의 backupCount 이상)
+MAX_BACKUPS = 9
+
+
+def file_identity(stat: os.stat_result) -> str:
+    return f"{stat.st_ino:x}" if stat.st_ino else f"{int(stat.st_ctime * 1000):x}"
+
+
+def parse_cursor(cursor: str | None) -> tuple[str, int] | None:
+    if not cursor or ":" not in cursor:
+        return None
+    identity, _, offset = cursor.rpartition(":")
+    try:
+        return identity, max(0, int(offset))
+    except ValueError:
+        return None
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    return [line.rstrip("\r") for line in data.decode("utf-8", errors="replace").split("\n")]
+
+
+def tail_lines(path: Path, max_lines: int, block_size: int = BLOCK_SIZE) -> tuple[list[str], str]:
+    """파일 끝에서 블록 단위로 거슬러 올라가며 마지막 max_lines줄만 읽음. (줄 목록, 커서) 반환"""
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        end = stat.st_size
+        position = end
+        data = b""
+        # 마지막 줄이 개행으로 끝나면 빈 줄이 하나 더 생기므로 max_lines + 1개의 개행을 찾음
+        while position > 0 and data.count(b"\n") <= max_lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    lines = _decode_lines(data)
+    if lines and lines[-1] == "":
+        lines.pop()
+    if position > 0:
+        lines = lines[1:]  # 블록 경계에서 잘린 첫 줄 제외
+    return lines[-max_lines:] if max_lines > 0 else [], f"{file_identity(stat)}:{end}"
+
+
+def _read_range(path: Path, offset: int, max_bytes: int) -> tuple[bytes, int, bool]:
+    """offset부터 완전한 줄까지만 읽음 (최대 max_bytes, 넘으면 앞부분을 버리고 truncated=True)"""
+    with open(path, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        truncated = end - offset > max_bytes
+        start = end - max_bytes if truncated else offset
+        f.seek(start)
+        data = f.read(end - start)
+    if truncated:
+        newline = data.find(b"\n")
+        data = data[newline + 1:] if newline != -1 else b""
+    last_newline = data.rfind(b"\n")
+    if last_newline == -1:
+        return b"", (offset if not truncated else end - len(data)), truncated
+    complete = data[: last_newline + 1]
+    return complete, end - (len(data) - len(complete)), truncated
+
+
+def read_since(path: Path, cursor: str, max_bytes: int = 256 * 1024) -> dict:
+    """커서 이후 새로 추가된 줄을 반환
+
+    반환: {"lines", "cursor", "rotated", "truncated"}. 커서가 잘못됐거나 파일이 없으면 lines는 비어 있다.
+    """
+    path = Path(path)
+    parsed = parse_cursor(cursor)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {"lines": [], "cursor": cursor, "rotated": False, "truncated": False}
+
+    identity = file_identity(stat)
+    chunks = []
+    rotated = False
+    truncated = False
+    offset = 0
+    if parsed is None:
+        return {"lines": [], "cursor": f"{identity}:{stat.st_size}", "rotated": False, "truncated": False}
+
+    old_identity, old_offset = parsed
+    if old_identity == identity and old_offset <= stat.st_size:
+        offset = old_offset
+    else:
+        # 로테이션(또는 잘림) 발생: 굴려진 이전 파일(.1, .2, ...)에서 커서 위치부터 순서대로 읽음
+        rotated = True
+        backups = []
+        found = False
+        for index in range(1, MAX_BACKUPS + 1):
+            backup = path.with_name(f"{path.name}.{index}")
+            try:
+                found = file_identity(os.stat(backup)) == old_identity
+            except OSError:
+                break
+            backups.append(backup)
+            if found:
+                break
+        if found:
+            start_offset = old_offset
+            for backup in reversed(backups):
+                data, _, was_truncated = _read_range(backup, start_offset, max_bytes)
+                chunks.append(data)
+                truncated = truncated or was_truncated
+                start_offset = 0
+        else:
+            truncated = True  # 커서가 가리키던 파일을 찾을 수 없음 (중간 로그 유실)
+
+    data, new_offset, was_truncated = _read_range(path, offset, max_bytes)
+    chunks.append(data)
+    truncated = truncated or was_truncated
+
+    # 여러 파일을 이어 읽은 경우에도 전체 크기는 max_bytes 이내로 (앞부분을 버림)
+    data = b"".join(chunks)
+    if len(data) > max_bytes:
+        data = data[-max_bytes:]
+        data = data[data.find(b"\n") + 1:]
+        truncated = True
+
+    lines = _decode_lines(data)
+    if lines and lines[-1] == "":
+        lines.pop()
+    return {
+        "lines": lines,
+        "cursor": f"{identity}:{new_offset}",
+        "rotated": rotated,
+        "truncated": truncated,
+    }
+
+
+_current_job_id = contextvars.ContextVar("log_job_id", default=None)
+
+
+def bind_job_id(job_id: str | None):
+    """현재 컨텍스트(스레드)의 로그 레코드에 job_id를 붙임. 반환한 토큰은 unbind_job_id에 전달
+
+    워커 스레드로 넘길 때는 contextvars.copy_context()로 함께 전달된다.
+    """
+    return _current_job_id.set(job_id)
+
+
+def unbind_job_id(token) -> None:
+    _current_job_id.reset(token)
+
+
+class JobContextFilter(logging.Filter):
+    """extra=로 job_id를 주지 않은 레코드에 현재 컨텍스트의 job_id를 채움"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "job_id", None) is None:
+            record.job_id = _current_job_id.get()
+        return True
+
+
+class LogRingBuffer(logging.Handler):
+    """최근 로그 레코드를 메모리에 보관하는 핸들러 (조회 시 디스크 I/O 없음)
+
+    deque(maxlen)의 append는 원자적이라 emit에서 락을 잡지 않는다. 레코드마다 증가하는
+    seq가 붙으므로 ?after=seq로 새 레코드만 이어 받을 수 있다.
+    job_id는 extra={"job_id": ...} 또는 bind_job_id()로 묶인 현재 컨텍스트에서 얻는다 (JobContextFilter).
+    """
+
+    def __init__(self, capacity: int = 2000, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.capacity = capacity
+        self._records = deque(maxlen=capacity)
+        self._seq = itertools.count(1)
+        self.addFilter(JobContextFilter())
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # 기본 구현은 핸들러 락을 잡고 emit하므로, 락 없이 바로 emit
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = record.getMessage()
+            if record.exc_info:
+                message = f"{message}\n{logging.Formatter().formatException(record.exc_info)}"
+            self._records.append({
+                "seq": next(self._seq),
+                "created": record.created,
+                "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+                "level": record.levelname,
+                "levelno": record.levelno,
+                "logger": record.name,
+                "message": message,
+                "job_id": getattr(record, "job_id", None),
+            })
+        except Exception:
+            self.handleError(record)
+
+    def snapshot(self) -> list[dict]:
+        while True:
+            try:
+                return list(self._records)
+            except RuntimeError:  # 복사 도중 다른 스레드가 append한 경우 다시 시도
+                continue
+
+    def query(self, level: int = logging.NOTSET, job_id: str | None = None, since: float | None = None,
+              until: float | None = None, after: int = 0, limit: int = 200) -> dict:
+        """조건에 맞는 레코드(오래된 순)와 다음 조회용 커서(seq) 반환
+
+        after가 없으면 최근 limit개, 있으면 after 이후 가장 오래된 limit개를 돌려주고 커서는 마지막으로
+        돌려준 레코드에 둔다 (limit에 걸려 남은 레코드가 있으면 truncated, 다음 조회에서 이어 받음).
+        """
+        records = self.snapshot()
+        matched = [
+            record for record in records
+            if record["seq"] > after
+            and record["levelno"] >= level
+            and (job_id is None or record["job_id"] == job_id)
+            and (since is None or record["created"] >= since)
+            and (until is None or record["created"] <= until)
+        ]
+        oldest = records[0]["seq"] if records else 0
+        truncated = len(matched) > limit
+        if after and truncated:
+            matched = matched[:limit]
+            cursor = matched[-1]["seq"]
+        else:
+            matched = matched[-limit:]
+            cursor = records[-1]["seq"] if records else after
+        return {
+            "records": [
+                {key: value for key, value in record.items() if key not in ("created", "levelno")}
+                for record in matched
+            ],
+            "cursor": cursor,
+            "truncated": truncated,
+            # after 이후의 레코드 일부가 이미 버퍼에서 밀려난 경우
+            "dropped": bool(after) and oldest > after + 1,
+            "capacity": self.capacity,
+        }
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""성능 지표 수집: Prometheus 텍스트 형식 카운터/히스토그램/게이지 + 작업별 요약
+
+전역 지표는 MetricsRegistry에 모아 /metrics에서 render()로 내보낸다.
+작업별 요약(JobMetrics)은 contextvar로 현재 작업에 묶어 두고, 워커 스레드로 넘길 때는
+contextvars.copy_context()로 함께 전달한다.
+"""
+import contextvars
+import math
+from threading import Lock
+
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labelnames, labelvalues, extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(labelnames, labelvalues)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}  # labels -> [버킷별 개수, 합계, 개수]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][idx] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, [list(series[0]), series[1], series[2]]) for key, series in self._series.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Gauge(_Metric):
+    """값을 직접 set하거나, 수집 시점에 callback()을 호출해 읽는 게이지
+
+    callback은 숫자 또는 {레이블 값 튜플: 숫자} dict를 반환한다.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames=(), callback=None):
+        super().__init__(name, help_text, labelnames)
+        self.callback = callback
+        self._values = {}
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def _samples(self) -> list[str]:
+        if self.callback is not None:
+            try:
+                result = self.callback()
+            except Exception:
+                return []
+            values = result if isinstance(result, dict) else {(): result}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._metrics = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames=()) -> Counter:
+        return self._register(Counter(self.prefix + name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self.prefix + name, help_text, labelnames, buckets))
+
+    def gauge(self, name: str, help_text: str, labelnames=(), callback=None) -> Gauge:
+        return self._register(Gauge(self.prefix + name, help_text, labelnames, callback))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class JobMetrics:
+    """작업 하나의 누적 지표 (status payload의 metrics 요약용, 스레드 안전)"""
+
+    MAX_LATENCY_SAMPLES = 10_000
+
+    def __init__(self):
+        self._lock = Lock()
+        self._latencies = []
+        self.counts = {
+            "llm_calls": 0,
+            "llm_errors": 0,
+            "retries": 0,
+            "input_chars": 0,
+            "output_chars": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cells_skipped": 0,
+            "glossary_misses": 0,
+            "stream_timeouts": 0,
+        }
+        self.durations = {}
+
+    def add(self, **amounts) -> None:
+        with self._lock:
+            for key, amount in amounts.items():
+                self.counts[key] = self.counts.get(key, 0) + amount
+
+    def observe_latency(self, seconds: float) -> None:
+        with self._lock:
+            if len(self._latencies) < self.MAX_LATENCY_SAMPLES:
+                self._latencies.append(seconds)
+
+    def set_duration(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[name] = round(seconds, 3)
+
+    def summary(self) -> dict:
+        with self._lock:
+            summary = dict(self.counts)
+            latencies = sorted(self._latencies)
+            summary.update({f"{name}_seconds": value for name, value in self.durations.items()})
+        lookups = summary["cache_hits"] + summary["cache_misses"]
+        summary["cache_hit_rate"] = round(summary["cache_hits"] / lookups, 4) if lookups else 0.0
+        if latencies:
+            summary["llm_latency"] = {
+                "avg": round(sum(latencies) / len(latencies), 3),
+                "p50": round(latencies[len(latencies) // 2], 3),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+                "max": round(latencies[-1], 3),
+            }
+        return summary
+
+
+_current_job = contextvars.ContextVar("current_job_metrics", default=None)
+
+
+def bind_job_metrics(job_metrics: JobMetrics | None):
+    """현재 컨텍스트(스레드)에 작업 지표를 연결. 반환한 토큰은 unbind_job_metrics에 전달"""
+    return _current_job.set(job_metrics)
+
+
+def unbind_job_metrics(token) -> None:
+    _current_job.reset(token)
+
+
+def current_job_metrics() -> JobMetrics | None:
+    return _current_job.get()
+
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""LLM 호출용 클라이언트 측 속도 제한 (분당 요청/토큰 버킷 + AIMD 동시성 제어)"""
+import logging
+import random
+import time
+from threading import Condition, Lock
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """분당 per_minute만큼 채워지는 토큰 버킷 (per_minute <= 0이면 제한 없음)"""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self._tokens = per_minute
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _refill_locked(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """amount만큼 예약하고 기다려야 할 시간(초)을 반환 (부족분은 빚으로 달아 둠)"""
+        if self.per_minute <= 0:
+            return 0.0
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * 60.0 / self.per_minute
+
+
+class AdaptiveConcurrency:
+    """AIMD 방식 동시 요청 수 제어
+
+    성공할 때마다 한도를 1/limit씩(대략 한 바퀴에 +1) 늘리고, 할당량 오류가 나면 절반으로
+    줄인 뒤 모든 호출을 잠시 멈춘다. 동시에 쏟아지는 429에 한도가 연달아 깎이지 않도록
+    감소는 cooldown 동안 한 번만 적용한다.
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 8, initial: float | None = None, cooldown: float = 5.0):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(initial if initial is not None else self.max_limit)
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def release(self, throttled: bool = False, pause: float = 0.0, grow: bool = True) -> None:
+        """슬롯 반납. grow=False면 한도를 늘리지 않음 (성공으로 볼 수 없는 요청)"""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            now = time.monotonic()
+            if throttled:
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self.limit = max(float(self.min_limit), self.limit / 2)
+                    logger.warning(f"LLM quota hit, concurrency limit lowered to {int(self.limit)}")
+                self.paused_until = max(self.paused_until, now + pause)
+            elif grow:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+            self._cond.notify_all()
+
+
+class LLMThrottle:
+    """요청/토큰 버킷과 적응형 동시성을 묶은 전역 호출 관문"""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        min_concurrency: int = 1,
+        max_concurrency: int = 8,
+        quota_pause: float = 2.0,
+    ):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = AdaptiveConcurrency(min_concurrency, max_concurrency)
+        self.quota_pause = quota_pause
+
+    def acquire(self, tokens: int) -> None:
+        self.concurrency.acquire()
+        wait = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self, throttled: bool = False, grow: bool = True) -> None:
+        pause = self.quota_pause * random.uniform(1.0, 2.0) if throttled else 0.0
+        self.concurrency.release(throttled=throttled, pause=pause, grow=grow)
+
+    def stats(self) -> dict:
+        return {
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+        }
+
+
+def backoff_with_jitter(base: float, attempt: int, cap: float = 60.0) -> float:
+    """지수 백오프에 equal jitter 적용: [d/2, d] 구간에서 무작위"""
+    delay = min(cap, base * (2 ** (attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""서버 시작 시간 측정 리포트
+
+1) python -X importtime 으로 app 모듈 임포트 비용을 측정해 누적 시간 상위 모듈을 출력
+2) 실제로 app.py를 실행해 /health가 응답하기까지 걸린 시간과 prewarm 완료 시간을 측정
+
+python startup_report.py [--top 20] [--no-server]
+"""
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.error import URLError
+from urllib.request import urlopen
+
+BASE_DIR = Path(__file__).resolve().parent
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def isolated_env(work_dir: Path, **extra) -> dict:
+    env = dict(os.environ)
+    env.update(
+        TRANSLATOR_DATA_DIR=str(work_dir / "data"),
+        TRANSLATOR_LOG_DIR=str(work_dir / "log"),
+        PYTHONDONTWRITEBYTECODE="1",
+    )
+    env.update(extra)
+    return env
+
+
+def measure_imports(env: dict) -> list[tuple[str, int, int, int]]:
+    """(모듈, self us, cumulative us, 깊이) 목록"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import app failed:\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_server_start(env: dict, work_dir: Path, timeout: float = 30.0) -> dict:
+    """app.py를 실행해 /health 첫 응답까지의 시간과 로그에 기록된 prewarm 완료 시간 측정"""
+    port = free_port()
+    env = dict(env, FLASK_PORT=str(port))
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "app.py"], cwd=BASE_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    health_seconds = None
+    prewarm_seconds = None
+    log_file = work_dir / "log" / "translation-server.log"
+    try:
+        while time.perf_counter() - started < timeout:
+            if health_seconds is None:
+                try:
+                    urlopen(f"http://127.0.0.1:{port}/health", timeout=1).read()
+                    health_seconds = time.perf_counter() - started
+                except (URLError, OSError):
+                    pass
+            if health_seconds is not None and log_file.exists():
+                if "Prewarm finished" in log_file.read_text(encoding="utf-8", errors="replace"):
+                    prewarm_seconds = time.perf_counter() - started
+                    break
+            if process.poll() is not None:
+                break
+            time.sleep(0.02)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return {"health_seconds": health_seconds, "prewarm_seconds": prewarm_seconds}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="서버 시작 시간 측정 (-X importtime + /health 응답 시간)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 모듈 수")
+    parser.add_argument("--no-server", action="store_true", help="서버 실행 측정 생략")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="translator-startup-") as tmp:
+        work_dir = Path(tmp)
+        env = isolated_env(work_dir)
+        entries = measure_imports(env)
+        app_entry = next((entry for entry in entries if entry[0] == "app"), None)
+
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        top_level = [entry for entry in entries if entry[3] <= 1]
+        for module, self_us, cumulative_us, depth in sorted(top_level, key=lambda e: -e[2])[: args.top]:
+            print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {'  ' * depth}{module}")
+        if app_entry:
+            print(f"\nimport app: {app_entry[2] / 1000:.1f} ms total ({app_entry[1] / 1000:.1f} ms in app.py itself)")
+
+        if not args.no_server:
+            timings = measure_server_start(env, work_dir)
+            if timings["health_seconds"] is None:
+                print("Server did not answer /health", file=sys.stderr)
+                return 1
+            print(f"process start -> /health: {timings['health_seconds'] * 1000:.0f} ms")
+            if timings["prewarm_seconds"] is not None:
+                print(f"process start -> prewarm done: {timings['prewarm_seconds'] * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+일괄 업로드(/upload/batch) zip 처리 테스트
+손상되었거나 암호가 걸린 zip은 서버 오류(500)가 아니라 잘못된 요청(400)으로 거절되는지 확인
+
+python test_batch_upload.py (pytest로도 실행 가능)
+"""
+import io
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+os.environ.setdefault("SERVER_PREWARM", "0")
+os.environ.setdefault("TRANSLATION_CACHE_ENABLED", "0")
+
+import app as server
+from llm_backends import LLMBackend
+
+
+class NullBackend(LLMBackend):
+    name = "null"
+
+    def generate(self, prompt: str, json_mode: bool = False) -> str:
+        raise AssertionError("업로드가 거절되어야 하므로 호출되지 않음")
+
+
+def post_batch(data: bytes, filename: str = "suite.zip"):
+    server.llm_backend = NullBackend("null")
+    client = server.app.test_client()
+    return client.post(
+        "/upload/batch",
+        data={"files": (io.BytesIO(data), filename)},
+        content_type="multipart/form-data",
+    )
+
+
+def encrypted_zip() -> bytes:
+    """암호화 플래그만 켠 zip (zipfile은 쓰기 시 플래그를 지우므로 헤더를 직접 고침)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("회귀.xlsx", b"not really encrypted")
+    data = bytearray(buffer.getvalue())
+    local = data.find(b"PK\x03\x04")
+    central = data.find(b"PK\x01\x02")
+    data[local + 6] |= 0x1
+    data[central + 8] |= 0x1
+    return bytes(data)
+
+
+def test_extract_rejects_corrupt_zip():
+    with tempfile.TemporaryDirectory() as tmp:
+        for data in (b"this is not a zip file", encrypted_zip()):
+            try:
+                server.extract_batch_archive(io.BytesIO(data), Path(tmp), 0, [1024 * 1024])
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("ValueError not raised")
+
+
+def test_upload_corrupt_zip_returns_400():
+    jobs_before = set(server.CHECKPOINT_FOLDER.iterdir()) if server.CHECKPOINT_FOLDER.exists() else set()
+    response = post_batch(b"PK\x03\x04 garbage that is not a zip archive")
+    assert response.status_code == 400, response.get_json()
+    assert "zip" in response.get_json()["error"]
+    # 거절된 업로드의 작업 폴더는 남지 않음
+    assert set(server.CHECKPOINT_FOLDER.iterdir()) == jobs_before
+
+
+def test_upload_encrypted_zip_returns_400():
+    response = post_batch(encrypted_zip())
+    assert response.status_code == 400, response.get_json()
+
+
+TESTS = [test_extract_rejects_corrupt_zip, test_upload_corrupt_zip_returns_400, test_upload_encrypted_zip_returns_400]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__}: {e}")
+    print(f"결과: {len(TESTS) - failed}/{len(TESTS)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+패치 writer(excel_io.write_patched_copy) 회귀 테스트
+결과 파일이 openpyxl로 열리고 zip 무결성 검사(testzip)를 통과하는지, 수정하지 않은 파트의 압축
+방식이 유지되는지, 원본 파트를 읽을 수 없으면 PatchError(호출자가 다른 writer로 대체)가 나는지 확인
+
+python test_excel_patch.py (pytest로도 실행 가능)
+"""
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+from excel_io import PatchError, write_patched_copy
+
+
+def make_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "TC"
+    ws.append(["TC ID", "Test Steps", "Expected Result"])
+    ws.append(["TC-1", "1. 앱을 실행한다\n2. 설정을 누른다", "설정 화면이 표시된다"])
+    ws.append(["TC-2", "로그인한다", "홈 화면이 표시된다"])
+    ws.column_dimensions["B"].width = 40
+    other = wb.create_sheet("기타")
+    other.append(["메모", "그대로 둔다"])
+    wb.save(path)
+
+
+TRANSLATIONS = {
+    "TC": {
+        (2, 2): "1. Launch the app\n2. Tap Settings",
+        (2, 3): "The settings screen is displayed",
+        (3, 3): "The home screen is displayed",
+    },
+}
+
+
+def test_patched_output_is_valid():
+    with tempfile.TemporaryDirectory() as tmp:
+        source, output = Path(tmp) / "in.xlsx", Path(tmp) / "out.xlsx"
+        make_workbook(source)
+        write_patched_copy(source, output, TRANSLATIONS)
+
+        with zipfile.ZipFile(output) as archive:
+            assert archive.testzip() is None
+        wb = load_workbook(output)
+        try:
+            ws = wb["TC"]
+            assert ws.cell(2, 2).value == "1. Launch the app\n2. Tap Settings"
+            assert ws.cell(2, 3).value == "The settings screen is displayed"
+            assert ws.cell(3, 2).value == "로그인한다"
+            assert ws.cell(3, 3).value == "The home screen is displayed"
+            assert ws.column_dimensions["B"].width == 40
+            assert wb["기타"].cell(1, 2).value == "그대로 둔다"
+        finally:
+            wb.close()
+
+
+def test_unchanged_parts_keep_compression():
+    with tempfile.TemporaryDirectory() as tmp:
+        source, stored, output = Path(tmp) / "in.xlsx", Path(tmp) / "stored.xlsx", Path(tmp) / "out.xlsx"
+        make_workbook(source)
+        # 일부 파트를 무압축(STORED)으로 다시 묶은 원본
+        with zipfile.ZipFile(source) as zin, zipfile.ZipFile(stored, "w") as zout:
+            for info in zin.infolist():
+                compress_type = zipfile.ZIP_STORED if info.filename.startswith("docProps/") else zipfile.ZIP_DEFLATED
+                zout.writestr(info.filename, zin.read(info), compress_type=compress_type)
+        write_patched_copy(stored, output, TRANSLATIONS)
+
+        with zipfile.ZipFile(stored) as zin, zipfile.ZipFile(output) as zout:
+            assert zout.testzip() is None
+            assert [info.filename for info in zout.infolist()] == [info.filename for info in zin.infolist()]
+            for info in zin.infolist():
+                if info.filename.startswith("docProps/"):
+                    assert zout.getinfo(info.filename).compress_type == zipfile.ZIP_STORED
+                    assert zout.read(info.filename) == zin.read(info)
+
+
+def test_unreadable_part_raises_patch_error():
+    with tempfile.TemporaryDirectory() as tmp:
+        source, output = Path(tmp) / "in.xlsx", Path(tmp) / "out.xlsx"
+        make_workbook(source)
+        # 번역하지 않는 파트(docProps/app.xml)의 CRC를 망가뜨림
+        data = bytearray(source.read_bytes())
+        with zipfile.ZipFile(source) as archive:
+            info = archive.getinfo("docProps/app.xml")
+        name = info.filename.encode("ascii")
+        data[info.header_offset + 14] ^= 0xFF  # 로컬 헤더의 CRC
+        central = data.find(b"PK\x01\x02")
+        while data[central + 46:central + 46 + len(name)] != name:
+            central = data.find(b"PK\x01\x02", central + 1)
+        data[central + 16] ^= 0xFF  # 중앙 디렉터리의 CRC
+        source.write_bytes(bytes(data))
+
+        try:
+            write_patched_copy(source, output, TRANSLATIONS)
+        except PatchError:
+            pass
+        else:
+            raise AssertionError("PatchError not raised")
+        assert not output.exists()
+
+
+TESTS = [test_patched_output_is_valid, test_unchanged_parts_keep_compression, test_unreadable_part_raises_patch_error]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__}: {e}")
+    print(f"결과: {len(TESTS) - failed}/{len(TESTS)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
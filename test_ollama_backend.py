@@ -0,0 +1,199 @@
+"""
+OllamaBackend / HTTPConnectionPool 테스트 (로컬 스텁 HTTP 서버 사용, Ollama 설치 불필요)
+generate, generate_stream(NDJSON), health, 첫 토큰/정체 제한 시간, keep-alive 연결 재사용 확인
+
+python test_ollama_backend.py (pytest로도 실행 가능)
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm_backends import LLMStreamTimeout, OllamaBackend
+
+MODEL = "stub-model:latest"
+
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    """/api/tags, /api/generate만 흉내 내는 스텁 (동작은 서버 속성으로 지정)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, data: dict) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: dict) -> None:
+        line = (json.dumps(data) + "\n").encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.flush()
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        if self.path == "/api/tags":
+            self._send_json({"models": [{"name": name} for name in self.server.models]})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        self.server.client_ports.append(self.client_address[1])
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        pieces = ["Launch", " the", " app"]
+        if not payload.get("stream"):
+            self._send_json({"response": "".join(pieces), "done": True})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            time.sleep(self.server.first_token_delay)
+            for index, piece in enumerate(pieces):
+                if index == 1:
+                    time.sleep(self.server.stall_delay)
+                self._write_chunk({"response": piece, "done": False})
+            self._write_chunk({"response": "", "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 제한 시간에 연결을 끊음
+
+
+class StubServer:
+    def __init__(self, models=(MODEL,), first_token_delay: float = 0.0, stall_delay: float = 0.0):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubOllamaHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.models = list(models)
+        self.httpd.first_token_delay = first_token_delay
+        self.httpd.stall_delay = stall_delay
+        self.httpd.client_ports = []
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self.httpd
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_generate():
+    with StubServer() as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        try:
+            assert backend.generate("prompt") == "Launch the app"
+        finally:
+            backend.close()
+
+
+def test_generate_stream():
+    with StubServer() as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        try:
+            pieces = list(backend.generate_stream("prompt", first_token_timeout=2, stall_timeout=2))
+            assert pieces == ["Launch", " the", " app"]
+        finally:
+            backend.close()
+
+
+def test_health():
+    with StubServer() as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        missing = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", "not-pulled", timeout=5)
+        try:
+            info = backend.health()
+            assert info["ready"] is True and MODEL in info["models"]
+            info = missing.health()
+            assert info["ready"] is False and "not-pulled" in info["error"]
+        finally:
+            backend.close()
+            missing.close()
+
+    # 서버가 없으면 ready=False와 오류 메시지
+    backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=1)
+    info = backend.health()
+    assert info["ready"] is False and info["error"]
+
+
+def test_first_token_timeout():
+    with StubServer(first_token_delay=1.0) as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        started = time.monotonic()
+        try:
+            list(backend.generate_stream("prompt", first_token_timeout=0.2, stall_timeout=2))
+        except LLMStreamTimeout as exc:
+            assert exc.phase == "first_token"
+            assert "timeout" in str(exc).lower()  # app의 재시도 판별 조건
+        else:
+            raise AssertionError("LLMStreamTimeout not raised")
+        assert time.monotonic() - started < 0.9
+        # 끊긴 스트림의 연결은 풀에 반납하지 않음
+        assert backend.pool._idle.qsize() == 0
+        backend.close()
+
+
+def test_stall_timeout():
+    with StubServer(stall_delay=1.0) as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        received = []
+        try:
+            for piece in backend.generate_stream("prompt", first_token_timeout=2, stall_timeout=0.2):
+                received.append(piece)
+        except LLMStreamTimeout as exc:
+            assert exc.phase == "stall"
+        else:
+            raise AssertionError("LLMStreamTimeout not raised")
+        assert received == ["Launch"]
+        assert backend.pool._idle.qsize() == 0
+        backend.close()
+
+
+def test_keepalive_connection_reused():
+    with StubServer() as httpd:
+        backend = OllamaBackend(f"http://127.0.0.1:{httpd.server_port}", MODEL, timeout=5)
+        try:
+            backend.generate("prompt")
+            assert backend.pool._idle.qsize() == 1
+            list(backend.generate_stream("prompt", first_token_timeout=2, stall_timeout=2))
+            assert backend.pool._idle.qsize() == 1
+            backend.list_models()
+            # 세 요청 모두 같은 클라이언트 소켓(포트)으로 처리됨
+            assert len(httpd.client_ports) == 3 and len(set(httpd.client_ports)) == 1
+        finally:
+            backend.close()
+
+
+TESTS = [
+    test_generate,
+    test_generate_stream,
+    test_health,
+    test_first_token_timeout,
+    test_stall_timeout,
+    test_keepalive_connection_reused,
+]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {type(e).__name__}: {e}")
+    print(f"결과: {len(TESTS) - failed}/{len(TESTS)} 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Steps 셀 분할/재조립 유틸리티 (번호 매긴 줄 단위)"""
+import re
+
+# 줄 앞의 번호/글머리표: "1.", "2)", "(3)", "1-2.", "-", "•", "①" 등
+# "1.5초"처럼 숫자가 이어지는 경우는 번호로 보지 않음
+_STEP_LINE = re.compile(
+    r"^(\s*(?:\(?\d{1,3}(?:[.-]\d{1,3})*[.)](?!\d)|[-*•·▪◦①-⑳])?\s*)(.*?)(\s*)$",
+    re.DOTALL,
+)
+
+
+def split_step_lines(text: str) -> list[tuple[str, str, str]]:
+    """셀 텍스트를 줄 단위 (prefix, body, suffix) 목록으로 분할
+
+    prefix는 들여쓰기와 번호, suffix는 줄 끝 공백(\\r 포함)이며 번역 대상은 body뿐이다.
+    """
+    parts = []
+    for line in text.split("\n"):
+        match = _STEP_LINE.match(line)
+        parts.append(match.groups() if match else ("", line, ""))
+    return parts
+
+
+def join_step_lines(parts: list[tuple[str, str, str]], translations: dict[str, str]) -> str:
+    """split_step_lines 결과에 번역된 body를 끼워 원래 줄 구조대로 재조립"""
+    return "\n".join(
+        prefix + (translations.get(body, body) if body.strip() else body) + suffix
+        for prefix, body, suffix in parts
+    )
+
+
+def segment_bodies(parts: list[tuple[str, str, str]]) -> list[str]:
+    """번역이 필요한 body 목록 (빈 줄 제외, 등장 순서 유지, 중복 제거)"""
+    return list(dict.fromkeys(body for _, body, _ in parts if body.strip()))
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정: ASCII는 4자당 1토큰, 한글 등 비ASCII는 1자당 1토큰"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+# 긴 텍스트를 나눌 경계: 줄바꿈 -> 문장 끝 -> 공백 순으로 시도하고, 그래도 길면 글자 수로 자름
+_CHUNK_BREAKS = (
+    re.compile(r"(\n+)"),
+    re.compile(r"((?<=[.!?。])\s+)"),
+    re.compile(r"(\s+)"),
+)
+
+
+def chunk_text(text: str, max_tokens: int, _level: int = 0) -> list[tuple[str, str]]:
+    """추정 토큰 수가 max_tokens를 넘는 텍스트를 경계에서 나눠 (조각, 뒤 구분자) 목록으로 반환
+
+    조각과 구분자를 순서대로 이으면 원문과 같다. 예산 안이면 [(text, "")] 그대로.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return [(text, "")]
+    if _level >= len(_CHUNK_BREAKS):
+        return [(text[start:start + max_tokens], "") for start in range(0, len(text), max_tokens)]
+
+    parts = _CHUNK_BREAKS[_level].split(text)
+    chunks = []
+    current, current_sep, current_tokens = None, "", 0
+    for segment, separator in zip(parts[0::2], parts[1::2] + [""]):
+        tokens = estimate_tokens(segment)
+        if tokens > max_tokens:
+            if current is not None:
+                chunks.append((current, current_sep))
+                current = None
+            pieces = chunk_text(segment, max_tokens, _level + 1)
+            pieces[-1] = (pieces[-1][0], pieces[-1][1] + separator)
+            chunks.extend(pieces)
+            continue
+        # 토큰 추정치를 더해 가면 실제보다 약간 크게 잡히므로 예산을 넘지 않음
+        joined_tokens = current_tokens + estimate_tokens(current_sep) + tokens
+        if current is not None and joined_tokens <= max_tokens:
+            current, current_sep, current_tokens = current + current_sep + segment, separator, joined_tokens
+        else:
+            if current is not None:
+                chunks.append((current, current_sep))
+            current, current_sep, current_tokens = segment, separator, tokens
+    if current is not None:
+        chunks.append((current, current_sep))
+    return chunks
+
+
+def join_chunks(chunks: list[tuple[str, str]], translations: dict[str, str]) -> str:
+    """chunk_text 결과에 번역된 조각을 끼워 재조립
+
+    translations는 앞뒤 공백을 뺀 조각 -> 번역이며, 조각 앞뒤 공백/줄바꿈은 원문 그대로 유지한다.
+    """
+    assembled = []
+    for chunk, separator in chunks:
+        body = chunk.strip()
+        if body:
+            lead = chunk[: len(chunk) - len(chunk.lstrip())]
+            trail = chunk[len(chunk.rstrip()):]
+            chunk = lead + translations.get(body, body) + trail
+        assembled.append(chunk + separator)
+    return "".join(assembled)
+
+
+# 한글 음절 + 호환/조합용 자모
+_HANGUL = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣]")
+
+
+def has_hangul(text: str) -> bool:
+    return _HANGUL.search(text) is not None
+
+
+def hangul_ratio(text: str) -> float:
+    """문자(letter) 중 한글 비율 (숫자/기호/공백은 세지 않음)"""
+    hangul = len(_HANGUL.findall(text))
+    if not hangul:
+        return 0.0
+    return hangul / sum(1 for ch in text if ch.isalpha())
+
+
+def needs_translation(text: str, threshold: float = 0.0) -> bool:
+    """한글이 있고 한글 비율이 threshold 이상이면 번역 대상 (영어/ID/URL/숫자/기호만 있는 셀은 제외)"""
+    if not has_hangul(text):
+        return False
+    return threshold <= 0 or hangul_ratio(text) >= threshold
+
+
+def has_untranslated_mix(text: str) -> bool:
+    """한글이 있는 줄과 한글 없이 글자만 있는 줄(이미 영어인 줄 등)이 섞여 있는지"""
+    lines = [line for line in text.split("\n") if any(ch.isalpha() for ch in line)]
+    return any(has_hangul(line) for line in lines) and not all(has_hangul(line) for line in lines)
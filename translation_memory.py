@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""SQLite 기반 번역 메모리 (원문 + context + 프롬프트 버전 + 모델 이름 단위 캐시)"""
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+_SPACE_RUN = re.compile(r"[ \t\u00a0\u3000]+")
+
+
+def normalize_source(text: str) -> str:
+    """캐시 키용 정규화: NFC, 줄 끝 공백/연속 공백/줄바꿈 형식 차이 무시"""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_SPACE_RUN.sub(" ", line).strip() for line in text.split("\n")]
+    return "\n".join(lines).strip()
+
+
+class TranslationMemory:
+    """스레드 안전한 영구 번역 캐시 (항목 수 상한 LRU + 최대 보관 기간)"""
+
+    EVICT_EVERY = 500  # put 횟수마다 한 번씩 정리
+
+    def __init__(self, db_path: Path, max_entries: int = 200_000, max_age_days: float = 180):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400 if max_age_days > 0 else None
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self._lock = Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                context TEXT NOT NULL,
+                model TEXT NOT NULL,
+                source TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used)")
+        self.evict()
+
+    @staticmethod
+    def make_key(text: str, context: str, prompt_version: str, model: str) -> str:
+        raw = "\x1f".join((prompt_version, model, context or "", normalize_source(text)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, text: str, context: str, prompt_version: str, model: str) -> str | None:
+        return self.get_many([text], context, prompt_version, model).get(text)
+
+    def get_many(self, texts, context: str, prompt_version: str, model: str) -> dict[str, str]:
+        """여러 원문을 한 번에 조회. 반환: 원문 -> 번역 (적중한 것만)"""
+        keys = {}
+        for text in texts:
+            keys.setdefault(self.make_key(text, context, prompt_version, model), []).append(text)
+        if not keys:
+            return {}
+
+        found = {}
+        now = time.time()
+        with self._lock:
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, translation, created_at FROM translations WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                hit_keys = []
+                for key, translation, created_at in rows:
+                    if self.max_age_seconds and now - created_at > self.max_age_seconds:
+                        continue
+                    hit_keys.append(key)
+                    for text in keys[key]:
+                        found[text] = translation
+                if hit_keys:
+                    self._conn.executemany(
+                        "UPDATE translations SET last_used = ?, hit_count = hit_count + 1 WHERE key = ?",
+                        [(now, key) for key in hit_keys],
+                    )
+            hit_count = len(found)
+            self.hits += hit_count
+            self.misses += len({text for group in keys.values() for text in group}) - hit_count
+        return found
+
+    def put(self, text: str, context: str, prompt_version: str, model: str, translation: str) -> None:
+        self.put_many([(text, translation)], context, prompt_version, model)
+
+    def put_many(self, pairs, context: str, prompt_version: str, model: str) -> None:
+        """(원문, 번역) 목록 저장"""
+        now = time.time()
+        rows = [
+            (self.make_key(text, context, prompt_version, model), context or "", model, text, translation, now, now)
+            for text, translation in pairs
+            if translation
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO translations (key, context, model, source, translation, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    translation = excluded.translation,
+                    created_at = excluded.created_at,
+                    last_used = excluded.last_used
+                """,
+                rows,
+            )
+            self._puts_since_evict += len(rows)
+            should_evict = self._puts_since_evict >= self.EVICT_EVERY
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """오래된 항목 삭제 후 상한을 넘는 항목은 최근 사용 순서(LRU)로 정리"""
+        removed = 0
+        with self._lock:
+            self._puts_since_evict = 0
+            if self.max_age_seconds:
+                cursor = self._conn.execute(
+                    "DELETE FROM translations WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+                )
+                removed += cursor.rowcount
+            if self.max_entries > 0:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    cursor = self._conn.execute(
+                        """
+                        DELETE FROM translations WHERE key IN (
+                            SELECT key FROM translations ORDER BY last_used ASC LIMIT ?
+                        )
+                        """,
+                        (overflow,),
+                    )
+                    removed += cursor.rowcount
+        if removed:
+            logger.info(f"Translation memory evicted {removed} entries")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": count,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()